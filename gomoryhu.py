@@ -0,0 +1,163 @@
+from mf import MF
+
+class GomoryHuTree:
+    """
+    Gusfield 알고리즘으로 무향 그래프의 Gomory-Hu 트리를 구성하여 모든 정점 쌍의 최소 컷 값을 구하는 클래스입니다.
+    정점 수를 V라 할 때 V - 1번의 최대 유량 계산만으로 트리를 만들며, 모든 계산은 하나의 MF 인스턴스를 재사용합니다.
+    두 정점 사이의 최소 컷 값은 트리 경로 위 간선 가중치의 최솟값이며, binary lifting으로 O(log V)에 구합니다.
+    """
+
+    def __init__(self, n: int):
+        """
+        Args:
+            n (int): 그래프의 정점 수
+        """
+
+        # 정점의 수
+        self.n = n
+
+        # 최소 컷 계산에 재사용할 최대 유량 그래프
+        self.mf = MF(n)
+
+        # Gomory-Hu 트리에서 각 정점의 부모 ( 루트는 0 )
+        self.parent = [0 for _ in range(n)]
+
+        # 각 정점과 부모를 잇는 트리 간선의 가중치 ( 두 정점 사이의 최소 컷 값 )
+        self.weight = [0 for _ in range(n)]
+
+        # binary lifting 테이블 ( 트리가 만들어지기 전에는 None )
+        self._up = self._min = self._depth = None
+
+    def add_edge(self, u: int, v: int, c: int) -> None:
+        """
+        정점 u와 v를 잇는 용량 c의 무향 간선을 추가합니다.
+
+        Args:
+            u (int): 간선의 한쪽 정점
+            v (int): 간선의 다른 쪽 정점
+            c (int): 간선의 용량
+        """
+
+        # 양방향 간선으로 추가
+        self.mf.add_edge(u, v, c, False)
+
+        # 그래프가 바뀌었으므로 트리를 다시 만들어야 함
+        self._up = None
+
+    def build(self) -> list[tuple[int, int, int]]:
+        """
+        Gusfield 알고리즘으로 Gomory-Hu 트리를 구성합니다.
+        정점 i = 1, ..., V - 1에 대해 i와 현재 부모 사이의 최소 컷을 구하고,
+        컷에서 i 쪽에 속하면서 부모가 같은 이후 정점들의 부모를 i로 바꿉니다.
+
+        Returns:
+            list[tuple[int, int, int]]: (정점, 부모, 가중치) 형태의 트리 간선 리스트
+        """
+
+        # 반복문에서 사용할 값들을 지역 변수로 가져옴
+        n, mf, parent, weight = self.n, self.mf, self.parent, self.weight
+
+        # 모든 정점의 부모를 0으로 초기화
+        for v in range(n):
+            parent[v] = 0
+
+        # 컷에서 i 쪽에 속하는지 여부를 표시할 리스트
+        side = [False for _ in range(n)]
+
+        for i in range(1, n):
+
+            # 이전 계산의 흐름을 지우고 i와 부모 사이의 최소 컷 계산
+            mf.reset()
+            weight[i] = mf.dinic(i, parent[i])
+
+            # 최소 컷에서 i 쪽에 속하는 정점 표시
+            for v in range(n):
+                side[v] = False
+            for v in mf.min_cut(i):
+                side[v] = True
+
+            # i 쪽에 속하면서 부모가 같은 이후 정점들의 부모를 i로 변경
+            for j in range(i + 1, n):
+                if side[j] and parent[j] == parent[i]:
+                    parent[j] = i
+
+        # 경로 최솟값 쿼리를 위한 binary lifting 테이블 구성
+        self._build_lifting()
+
+        # 트리 간선 리스트 반환
+        return [(v, parent[v], weight[v]) for v in range(1, n)]
+
+    def query(self, u: int, v: int) -> int:
+        """
+        두 정점 u와 v 사이의 최소 컷 값을 반환합니다.
+        트리가 아직 만들어지지 않았다면 먼저 'build'를 수행합니다.
+
+        Args:
+            u (int): 첫 번째 정점
+            v (int): 두 번째 정점
+
+        Returns:
+            int: u와 v 사이의 최소 컷 값 ( u와 v가 같으면 INF )
+        """
+
+        # 트리가 없는 경우 트리 구성
+        if self._up is None:
+            self.build()
+
+        up, mn, depth = self._up, self._min, self._depth
+
+        # 경로 위 간선 가중치의 최솟값
+        res = float('inf')
+
+        # u가 더 깊은 정점이 되도록 교환
+        if depth[u] < depth[v]:
+            u, v = v, u
+
+        # u를 v와 같은 깊이까지 끌어올림
+        diff, k = depth[u] - depth[v], 0
+        while diff:
+            if diff & 1:
+                res = min(res, mn[k][u])
+                u = up[k][u]
+            diff >>= 1
+            k += 1
+
+        # 같은 정점이 되었다면 결과 반환
+        if u == v:
+            return res
+
+        # 최소 공통 조상 바로 아래까지 함께 끌어올림
+        for k in range(len(up) - 1, -1, -1):
+            if up[k][u] != up[k][v]:
+                res = min(res, mn[k][u], mn[k][v])
+                u, v = up[k][u], up[k][v]
+
+        # 최소 공통 조상으로 가는 마지막 두 간선 반영
+        return min(res, mn[0][u], mn[0][v])
+
+    def _build_lifting(self) -> None:
+        """
+        트리의 각 정점에 대해 2^k번째 조상과 그 경로 위 간선 가중치의 최솟값을 계산합니다.
+        Gusfield 알고리즘에서 부모의 번호는 항상 자식보다 작으므로, 번호 순서대로 깊이를 계산할 수 있습니다.
+        """
+
+        n, parent, weight = self.n, self.parent, self.weight
+
+        # 각 정점의 깊이
+        depth = [0 for _ in range(n)]
+        for v in range(1, n):
+            depth[v] = depth[parent[v]] + 1
+
+        # 2^0번째 조상과 가중치 ( 루트의 부모는 자기 자신, 가중치는 INF )
+        up = [parent[:]]
+        mn = [weight[:]]
+        if n:
+            mn[0][0] = float('inf')
+
+        # 2^k번째 조상과 경로 최솟값 계산
+        for _ in range(max(n - 1, 1).bit_length() - 1):
+            prev_up, prev_mn = up[-1], mn[-1]
+            up.append([prev_up[prev_up[v]] for v in range(n)])
+            mn.append([min(prev_mn[v], prev_mn[prev_up[v]]) for v in range(n)])
+
+        self._up, self._min, self._depth = up, mn, depth
@@ -0,0 +1,142 @@
+class Hungarian:
+    """
+    헝가리안 알고리즘( Kuhn-Munkres )으로 할당 문제를 푸는 클래스입니다.
+
+    n x m 비용 행렬이 주어질 때 각 행을 서로 다른 열에 하나씩 배정하여 비용의 합을 최소화합니다.
+    MCMF로 이분 그래프를 만들어 푸는 것과 같은 답을 주지만, 간선 배열 없이 행렬 위에서 정점 포텐셜만 관리하므로
+    밀집 행렬에서 훨씬 빠르며 시간 복잡도는 O(n^2 m)입니다.
+    행보다 열이 적은 직사각 행렬은 전치하여 풀며, 이 때 배정받지 못한 행은 -1로 표시됩니다.
+    """
+
+    def __init__(self, cost, maximize: bool=False):
+        """
+        Args:
+            cost (list[list[int]]): n x m 비용 행렬, 'tolist' 메서드가 있는 객체( NumPy 배열 등 )도 받음
+            maximize (bool, optional): True이면 비용의 합을 최대화, 기본값은 False
+        """
+
+        # NumPy 배열 등은 파이썬 리스트로 변환하여 원소 접근 비용을 줄임
+        if hasattr(cost, 'tolist'):
+            cost = cost.tolist()
+
+        # 비용 행렬 ( 최대화인 경우 부호를 뒤집어 최소화 문제로 바꿈 )
+        self.cost = [[-x for x in row] for row in cost] if maximize else [list(row) for row in cost]
+
+        # 최대화 여부
+        self.maximize = maximize
+
+        # 행의 수와 열의 수
+        self.n = len(self.cost)
+        self.m = len(self.cost[0]) if self.cost else 0
+
+        # 각 행이 배정된 열 ( 풀기 전에는 None )
+        self.assignment = None
+
+    def solve(self) -> tuple[list[int], int]:
+        """
+        할당 문제를 풀어 각 행이 배정된 열과 총 비용을 구하는 함수입니다.
+
+        Returns:
+            tuple[list[int], int]: ( 각 행이 배정된 열의 리스트, 총 비용 )
+        """
+
+        # 행보다 열이 적으면 전치하여 풀고, 열 -> 행 배정을 행 -> 열 배정으로 되돌림
+        if self.n > self.m:
+            match = self._solve([list(col) for col in zip(*self.cost)])
+            self.assignment = [-1 for _ in range(self.n)]
+            for j, i in enumerate(match):
+                self.assignment[i] = j
+        else:
+            self.assignment = self._solve(self.cost)
+
+        # 배정된 칸의 비용을 더해 총 비용 계산
+        total = sum(self.cost[i][j] for i, j in enumerate(self.assignment) if j != -1)
+
+        return self.assignment, -total if self.maximize else total
+
+    @staticmethod
+    def _solve(a: list[list[int]]) -> list[int]:
+        """
+        행의 수 n이 열의 수 m 이하인 비용 행렬 a에 대해 각 행이 배정될 열을 구하는 함수입니다.
+
+        행을 하나씩 추가하면서 Dijkstra와 같은 방식으로 축약 비용 a[i][j] - u[i] - v[j]가 가장 작은 열을 골라
+        증가 경로를 찾고, 경로를 찾는 동안 포텐셜 u, v를 갱신하여 모든 칸의 축약 비용이 음수가 되지 않도록 유지합니다.
+
+        Args:
+            a (list[list[int]]): n x m 비용 행렬 ( n <= m )
+
+        Returns:
+            list[int]: 각 행이 배정된 열의 리스트
+        """
+
+        n, m = len(a), len(a[0]) if a else 0
+        INF = float('inf')
+
+        # 행 포텐셜은 각 행의 최솟값으로 시작 ( 행 축약 )
+        u = [min(row) for row in a]
+
+        # 정사각 행렬이면 열 포텐셜도 행 축약 후 각 열의 최솟값으로 시작 ( 열 축약 )
+        # 직사각 행렬에서는 배정되지 않는 열의 포텐셜이 양수가 되면 안 되므로 0으로 시작
+        if n == m:
+            v = [min(x - ui for x, ui in zip(col, u)) for col in zip(*a)] + [0]
+        else:
+            v = [0 for _ in range(m + 1)]
+
+        # p[j]: 열 j에 배정된 행 ( 없으면 -1 ), 열 m은 새로 추가하는 행을 가리키는 가상의 열
+        p = [-1 for _ in range(m + 1)]
+
+        # way[j]: 증가 경로에서 열 j 직전의 열
+        way = [0 for _ in range(m + 1)]
+
+        for i in range(n):
+
+            # 가상의 열 m에 행 i를 배정하고 탐색 시작
+            p[m] = i
+            j0 = m
+
+            # minv[j]: 지금까지 방문한 행에서 열 j로 가는 최소 축약 비용, used[j]: 열 j의 방문 여부
+            minv = [INF for _ in range(m + 1)]
+            used = [False for _ in range(m + 1)]
+
+            while True:
+
+                # 열 j0를 방문하고, 열 j0에 배정된 행 i0에서 나가는 칸들로 minv 갱신
+                used[j0] = True
+                i0 = p[j0]
+                row, ui = a[i0], u[i0]
+                delta, j1 = INF, -1
+                for j in range(m):
+                    if not used[j]:
+                        cur = row[j] - ui - v[j]
+                        if cur < minv[j]:
+                            minv[j] = cur
+                            way[j] = j0
+                        if minv[j] < delta:
+                            delta, j1 = minv[j], j
+
+                # 방문한 행과 열의 포텐셜을 delta만큼 조정하여 열 j1로 가는 칸의 축약 비용을 0으로 만듦
+                for j in range(m + 1):
+                    if used[j]:
+                        u[p[j]] += delta
+                        v[j] -= delta
+                    else:
+                        minv[j] -= delta
+
+                # 배정되지 않은 열에 도달하면 증가 경로 완성
+                j0 = j1
+                if p[j0] == -1:
+                    break
+
+            # 증가 경로를 따라 거슬러 올라가며 배정을 뒤집음
+            while j0 != m:
+                j1 = way[j0]
+                p[j0] = p[j1]
+                j0 = j1
+
+        # 열 -> 행 배정을 행 -> 열 배정으로 변환
+        ans = [-1 for _ in range(n)]
+        for j in range(m):
+            if p[j] != -1:
+                ans[p[j]] = j
+
+        return ans
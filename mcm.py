@@ -0,0 +1,180 @@
+from array import array
+from itertools import accumulate
+
+class MaximumCardinalityMatching:
+    """
+    Edmonds의 블로섬 알고리즘으로 일반 그래프의 최대 매칭( 간선의 수를 최대화하는 매칭 )을 구하는 클래스입니다.
+
+    가중치가 모두 같은 그래프에서는 MaximumWeightedMatching의 이중 변수와 힙이 필요 없으므로,
+    BFS로 교대 트리를 키우면서 홀수 사이클( 블로섬 )을 union-find로 축약하는 방식만으로 증가 경로를 찾습니다.
+    탐욕적 매칭으로 시작한 뒤 매칭되지 않은 정점마다 한 번씩 탐색하며, 시간 복잡도는 O(VE α(V))입니다.
+    정점 번호와 반환 형식은 MaximumWeightedMatching과 같습니다. ( 1번부터 시작, 매칭되지 않은 정점의 짝은 0 )
+    """
+
+    def __init__(self, n: int):
+        """
+        Args:
+            n (int): 노드의 개수
+        """
+
+        # 노드의 개수
+        self.N = n
+
+        # 입력받은 간선의 양 끝 정점
+        self.us = array('i')
+        self.vs = array('i')
+
+    def add_edge(self, u: int, v: int, w: int=1) -> None:
+        """
+        두 노드 u와 v를 잇는 무향 간선을 추가합니다.
+
+        Args:
+            u (int): 간선의 첫 번째 노드
+            v (int): 간선의 두 번째 노드
+            w (int, optional): 간선의 가중치, MaximumWeightedMatching과 같은 방식으로 호출할 수 있도록 받기만 하고 사용하지 않음
+        """
+
+        # 자기 자신으로 가는 간선은 매칭에 쓰일 수 없으므로 무시
+        if u != v:
+            self.us.append(u)
+            self.vs.append(v)
+
+    def maximum_matching(self) -> tuple[int, list[int]]:
+        """
+        최대 매칭을 찾습니다.
+
+        Returns:
+            tuple[int, list[int]]: 매칭의 크기( 간선의 수 )와 각 노드의 짝을 담은 리스트 ( 짝이 없으면 0 )
+        """
+
+        n = self.N
+
+        # CSR 형식의 인접 리스트 구성
+        offset = [0 for _ in range(n + 2)]
+        for u in self.us:
+            offset[u + 1] += 1
+        for v in self.vs:
+            offset[v + 1] += 1
+        offset = list(accumulate(offset))
+        adj = array('i', [0]) * offset[-1]
+        pos = offset[:]
+        for u, v in zip(self.us, self.vs):
+            adj[pos[u]] = v
+            pos[u] += 1
+            adj[pos[v]] = u
+            pos[v] += 1
+
+        # 각 노드의 짝
+        mate = [0 for _ in range(n + 1)]
+
+        # 탐욕적으로 초기 매칭 구성
+        size = 0
+        for u in range(1, n + 1):
+            if not mate[u]:
+                for i in range(offset[u], offset[u + 1]):
+                    if not mate[v := adj[i]]:
+                        mate[u], mate[v] = v, u
+                        size += 1
+                        break
+
+        # label[v]: -1은 미방문, 0은 외부( 짝수 ) 정점, 1은 내부( 홀수 ) 정점
+        label = [-1 for _ in range(n + 1)]
+
+        # link[v]: 내부 정점은 자신을 발견한 외부 정점, 블로섬에 흡수된 외부 정점은 블로섬을 닫은 간선의 반대쪽 정점
+        link = [0 for _ in range(n + 1)]
+
+        # 블로섬 축약을 위한 union-find ( 각 정점이 속한 블로섬의 베이스 )
+        root = list(range(n + 1))
+
+        # 최소 공통 조상 탐색에서 방문 표시에 쓰는 타임스탬프
+        stamp = [0 for _ in range(n + 1)]
+        clock = 0
+
+        def find(x: int) -> int:
+            # 경로 절반 압축으로 블로섬의 베이스를 찾음
+            while root[x] != x:
+                root[x] = root[root[x]]
+                x = root[x]
+            return x
+
+        def lca(x: int, y: int) -> int:
+            # 두 외부 정점에서 번갈아 루트 방향으로 올라가며 먼저 두 번 방문되는 블로섬의 베이스를 찾음
+            nonlocal clock
+            clock += 1
+            x, y = find(x), find(y)
+            while True:
+                if x:
+                    if stamp[x] == clock:
+                        return x
+                    stamp[x] = clock
+                    x = find(link[mate[x]]) if mate[x] else 0
+                x, y = y, x
+
+        def blossom(x: int, y: int, base: int) -> None:
+            # x에서 베이스까지의 경로를 블로섬으로 축약하고, 내부 정점이었던 정점들을 외부 정점으로 바꿔 큐에 추가
+            while find(x) != base:
+                link[x] = y
+                y = mate[x]
+                if label[y] == 1:
+                    label[y] = 0
+                    queue.append(y)
+                if root[x] == x:
+                    root[x] = base
+                if root[y] == y:
+                    root[y] = base
+                x = link[y]
+
+        # 매칭되지 않은 정점마다 증가 경로 탐색
+        for s in range(1, n + 1):
+            if mate[s]:
+                continue
+
+            # 이번 탐색에서 상태가 바뀐 정점들 ( 탐색 후 이 정점들만 초기화 )
+            touched = [s]
+            label[s] = 0
+            queue = [s]
+            found = False
+
+            for x in queue:
+                for i in range(offset[x], offset[x + 1]):
+                    y = adj[i]
+
+                    # 처음 도달한 정점은 내부 정점이 되고, 그 짝은 외부 정점이 됨
+                    if label[y] == -1:
+                        label[y] = 1
+                        link[y] = x
+                        touched.append(y)
+
+                        # 매칭되지 않은 정점이면 증가 경로를 따라 매칭을 뒤집음
+                        if not mate[y]:
+                            while y:
+                                x = link[y]
+                                z = mate[x]
+                                mate[y], mate[x] = x, y
+                                y = z
+                            found = True
+                            break
+
+                        z = mate[y]
+                        label[z] = 0
+                        touched.append(z)
+                        queue.append(z)
+
+                    # 다른 블로섬의 외부 정점끼리 이어지면 홀수 사이클이므로 블로섬으로 축약
+                    elif label[y] == 0 and find(x) != find(y):
+                        base = lca(x, y)
+                        blossom(x, y, base)
+                        blossom(y, x, base)
+
+                if found:
+                    break
+
+            if found:
+                size += 1
+
+            # 이번 탐색에서 사용한 상태 초기화
+            for v in touched:
+                label[v] = -1
+                root[v] = v
+
+        return size, mate
@@ -1,8 +1,11 @@
+from array import array
 from collections import deque
+from heapq import heappush, heappop, heapify
 
 class MCMF:
     """
     최소 비용 최대 유량(Minimum Cost Maximum Flow, MCMF) 알고리즘을 SPFA를 이용하여 구현한 클래스입니다.
+    간선은 정방향 e와 역방향 e ^ 1이 쌍을 이루는 간선 배열에 저장되어 메모리가 간선 수에 비례합니다.
     """
 
     def __init__(self, v: int):
@@ -10,17 +13,23 @@ class MCMF:
         # v개의 정점을 가진 유량 그래프 초기화
         self.size = v
 
-        # 그래프의 인접 리스트
-        self.adj = [[] for _ in range(v)]
+        # 각 정점에서 마지막으로 추가된 간선의 번호를 저장하는 배열 ( 간선이 없으면 -1 )
+        self.head = array('i', [-1]) * v
 
-        # 용량을 저장하는 인접 리스트
-        self.cap = [[0 for _ in range(v)] for _ in range(v)]
+        # 간선의 도착 정점을 저장하는 배열
+        self.to = array('i')
 
-        # 흐름을 저장하는 인접 리스트
-        self.flow = [[0 for _ in range(v)] for _ in range(v)]
+        # 간선의 용량을 저장하는 배열
+        self.cap = array('q')
 
-        # 비용을 저장하는 인접 리스트
-        self.cost = [[0 for _ in range(v)] for _ in range(v)]
+        # 간선의 흐름을 저장하는 배열
+        self.flow = array('q')
+
+        # 간선의 비용을 저장하는 리스트 ( 실수 비용도 허용하기 위해 array 대신 리스트 사용 )
+        self.cost = []
+
+        # 같은 정점에서 출발하는 다음 간선의 번호를 저장하는 배열 ( 마지막 간선이면 -1 )
+        self.next = array('i')
 
         # 각 노드까지의 거리를 저장하는 리스트
         self.dist = [0 for _ in range(v)]
@@ -34,9 +43,13 @@ class MCMF:
         # 총 비용
         self.total_cost = 0
 
-    def add_edge(self, u: int, v: int, w: int, c: float, d: bool=True):
+        # 'resolve'에서 반영할 비용, 용량 변경 목록
+        self._pending = []
+
+    def add_edge(self, u: int, v: int, w: int, c: float, d: bool=True) -> int:
         """
         u에서 v로 가는 간선과 v에서 u로 가는 역방향 간선을 추가합니다.
+        정방향 간선은 짝수 번호 e, 역방향 간선은 e ^ 1 번호로 쌍을 이루어 저장되므로 같은 정점 쌍 사이의 평행 간선도 각각 유지됩니다.
         양방향 간선이 아닌 경우, 역방향 간선도 추가됩니다.
         
         Args:
@@ -45,22 +58,29 @@ class MCMF:
             w (int): 간선의 용량
             c (float): 간선의 비용
             d (bool, optional): 양방향 간선인지의 여부
-        """
 
-        # u에서 v로 가는 간선 추가
-        self.adj[u].append(v)
-
-        # v에서 u로 가는 간선 추가
-        self.adj[v].append(u)
+        Returns:
+            int: 추가된 정방향 간선의 번호
+        """
 
-        # 용량 저장
-        self.cap[u][v] = w
+        # 새로 추가될 정방향 간선의 번호
+        e = len(self.to)
 
-        # 비용 저장
-        self.cost[u][v] = c
+        # u에서 v로 가는 간선 추가
+        self.to.append(v)
+        self.cap.append(w)
+        self.flow.append(0)
+        self.cost.append(c)
+        self.next.append(self.head[u])
+        self.head[u] = e
 
-        # 역방향 간선의 비용 저장
-        self.cost[v][u] = -c
+        # v에서 u로 가는 역방향 간선 추가 ( 용량 0, 비용 -c )
+        self.to.append(u)
+        self.cap.append(0)
+        self.flow.append(0)
+        self.cost.append(-c)
+        self.next.append(self.head[v])
+        self.head[v] = e ^ 1
 
         # 양방향 간선이 아닌 경우
         if not d:
@@ -68,7 +88,76 @@ class MCMF:
             # 역방향 간선 추가
             self.add_edge(v, u, w, c)
 
-    def mcmf(self, s: int, t: int) -> tuple[int, float]:
+        # 정방향 간선의 번호 반환
+        return e
+
+    @classmethod
+    def from_arrays(cls, n: int, us, vs, caps, costs) -> 'MCMF':
+        """
+        간선들의 시작 정점, 도착 정점, 용량, 비용 배열로부터 유량 그래프를 한 번에 구성합니다.
+        'add_edge'를 간선마다 호출하지 않고 간선 배열을 직접 채웁니다.
+        간선 배열을 슬라이스 대입으로 채우며, 만들어진 그래프는 같은 순서로 'add_edge'를 호출한 것과 동일합니다 ( i번째 간선의 번호는 2 * i ).
+
+        Args:
+            n (int): 정점의 수
+            us: 간선의 시작 정점 배열 ( list, array('q'), NumPy 배열 등 )
+            vs: 간선의 도착 정점 배열
+            caps: 간선의 용량 배열
+            costs: 간선의 비용 배열
+
+        Returns:
+            MCMF: 간선이 모두 추가된 유량 그래프
+        """
+
+        # 빈 그래프 생성
+        g = cls(n)
+
+        # 입력을 간선 배열과 같은 타입의 array로 변환 ( 비용은 리스트 )
+        us, vs, caps = cls._as_array('i', us), cls._as_array('i', vs), cls._as_array('q', caps)
+        costs = costs.tolist() if hasattr(costs, 'tolist') else list(costs)
+
+        # 간선 쌍의 개수의 두 배만큼 간선 배열 할당
+        m = 2 * len(caps)
+        g.to, g.cap, g.flow, g.next = array('i', [0]) * m, array('q', [0]) * m, array('q', [0]) * m, array('i', [0]) * m
+        g.cost = [0] * m
+
+        # 정방향 간선은 짝수 번호, 역방향 간선은 홀수 번호에 채움
+        g.to[0::2], g.to[1::2] = vs, us
+        g.cap[0::2] = caps
+        g.cost[0::2], g.cost[1::2] = costs, [-c for c in costs]
+
+        # 간선 번호 순서대로 각 정점의 간선 연결 리스트 구성 ( 간선 e의 시작 정점은 to[e ^ 1] )
+        head, to, nxt = g.head, g.to, g.next
+        for e in range(m):
+            u = to[e ^ 1]
+            nxt[e] = head[u]
+            head[u] = e
+
+        # 구성된 그래프 반환
+        return g
+
+    @staticmethod
+    def _as_array(typecode: str, values) -> array:
+        """
+        주어진 값들을 지정한 타입의 array로 변환합니다.
+        이미 같은 타입의 array라면 그대로 반환하고, NumPy 배열처럼 'tolist'를 지원하는 객체는 한 번에 변환합니다.
+
+        Args:
+            typecode (str): 변환할 array의 타입 코드
+            values: 변환할 값들
+
+        Returns:
+            array: 변환된 배열
+        """
+
+        # 같은 타입의 array는 복사하지 않음
+        if isinstance(values, array) and values.typecode == typecode:
+            return values
+
+        # tolist를 지원하면 파이썬 리스트로 바꾼 뒤 변환
+        return array(typecode, values.tolist() if hasattr(values, 'tolist') else values)
+
+    def mcmf(self, s: int, t: int, algorithm: str = "spfa") -> tuple[int, float]:
         """
         최소 비용 최대 유량(Minimum Cost Maximum Flow, MCMF) 알고리즘을 수행하는 함수입니다.
 
@@ -76,36 +165,696 @@ class MCMF:
 
         시작 정점에서 도착 정점까지의 경로를 찾고 유량을 계산합니다.
 
+        'algorithm'이 "dijkstra"이면 첫 단계에서만 SPFA로 정점 포텐셜을 구하고,
+        이후 단계에서는 축소 비용(reduced cost) 위의 힙 기반 Dijkstra로 최단 경로를 구합니다 ( primal-dual ).
+        "cost_scaling"이면 'cost_scaling'을 사용합니다 ( 정수 비용 전용 ).
+
         최대 유량과 최소 비용을 반환합니다.
         
         Args:
             s (int): 시작 정점
             t (int): 도착 정점
+            algorithm (str, optional): "spfa", "dijkstra" 또는 "cost_scaling", 기본값은 "spfa"
         
         Returns:
             tuple[int, float]: 최대 유량과 최소 비용을 담은 튜플
         """
 
-        # 최대 유량, 최소 비용
-        mf = mc = 0
+        # 비용 스케일링은 경로 단위로 진행하지 않으므로 별도로 수행
+        if algorithm == "cost_scaling":
+            return self.cost_scaling(s, t)
+
+        # 최대 유량, 호출 전까지의 총 비용
+        mf, base = 0, self.total_cost
+
+        # 단계마다 최단 경로를 구할 메소드 ( 첫 단계는 음수 비용 간선이 있을 수 있으므로 항상 SPFA )
+        shortest_path = {"spfa": self.spfa, "dijkstra": self.dijkstra}[algorithm]
 
         # 시작 노드에서 도착 노드까지의 최단 경로가 존재하는 동안 반복
-        while self.spfa(s, t):
+        found = self.spfa(s, t)
+        while found:
+
+            # 마지막 방문한 간선 배열을 각 노드의 첫 번째 간선으로 초기화
+            self.last = self.head.tolist()
+
+            # 최단 경로 DAG에서 blocking flow를 구하여 최대 유량 업데이트
+            mf += self.blocking_flow(s, t)
+
+            # 다음 단계의 최단 경로 계산
+            found = shortest_path(s, t)
+
+        # 최대 유량과 이번 호출에서 보낸 유량의 총 비용 반환
+        return mf, self.total_cost - base
+
+    def min_cost_flow(self, s: int, t: int, limit: int) -> tuple[int, float]:
+        """
+        시작 정점에서 도착 정점으로 최대 limit만큼의 유량을 최소 비용으로 보내는 함수입니다.
+        limit만큼 보내면 더 이상 증가 경로를 찾지 않으므로, 최대 유량까지 보낼 필요가 없을 때 불필요한 단계를 건너뜁니다.
+
+        Args:
+            s (int): 시작 정점
+            t (int): 도착 정점
+            limit (int): 보낼 유량의 상한
+
+        Returns:
+            tuple[int, float]: 보낸 유량과 그 최소 비용을 담은 튜플 ( 유량은 최대 유량이 limit보다 작으면 최대 유량 )
+        """
+
+        # 비용 곡선의 마지막 꺾이는 점이 보낸 유량과 비용
+        return self.slope(s, t, limit)[-1]
+
+    def slope(self, s: int, t: int, limit: int | None = None) -> list[tuple[int, float]]:
+        """
+        보낸 유량에 대한 최소 비용 곡선 cost(flow)의 꺾이는 점들을 한 번의 실행으로 구하는 함수입니다.
+
+        연속 최단 경로 알고리즘의 각 단계에서는 단위 유량당 비용( 최단 경로의 길이 )이 일정하고 단계가 진행될수록 커지므로,
+        cost(flow)는 볼록한 구간별 선형 함수이고 각 단계가 끝나는 점이 꺾이는 점이 됩니다.
+        첫 단계에서만 SPFA를 사용하고 이후 단계에서는 포텐셜 위의 Dijkstra를 사용합니다.
+        기울기가 같은 단계가 이어지면 하나의 구간으로 합칩니다.
+
+        Args:
+            s (int): 시작 정점
+            t (int): 도착 정점
+            limit (int | None, optional): 보낼 유량의 상한, 기본값은 None ( 최대 유량까지 )
+
+        Returns:
+            list[tuple[int, float]]: (0, 0)에서 시작하는 (유량, 비용) 꺾이는 점들의 리스트
+        """
+
+        # 꺾이는 점들, 보낸 유량, 호출 전까지의 총 비용, 직전 구간의 기울기
+        points, mf, base, prev = [(0, 0)], 0, self.total_cost, None
+
+        # 보낼 수 있는 남은 유량
+        remain = float('inf') if limit is None else limit
+
+        # 시작 노드에서 도착 노드까지의 최단 경로가 존재하고 보낼 유량이 남아있는 동안 반복
+        found = self.spfa(s, t)
+        while found and remain > 0:
+
+            # 이번 단계의 단위 유량당 비용
+            unit = self.dist[t] - self.dist[s]
+
+            # 마지막 방문한 간선 배열을 각 노드의 첫 번째 간선으로 초기화
+            self.last = self.head.tolist()
+
+            # 남은 유량을 넘지 않도록 최단 경로 DAG에서 blocking flow를 구하여 유량을 보냄
+            f = self.blocking_flow(s, t, remain)
+            mf += f
+            remain -= f
+
+            # 직전 구간과 기울기가 같으면 직전 점을 대체
+            if unit == prev:
+                points.pop()
+            points.append((mf, self.total_cost - base))
+            prev = unit
+
+            # 다음 단계의 최단 경로 계산
+            found = self.dijkstra(s, t)
+
+        # 꺾이는 점들 반환
+        return points
+
+    def update_cost(self, e: int, c: float) -> None:
+        """
+        간선 e의 비용을 c로 바꿉니다. 변경 사항은 다음 'resolve' 호출에서 반영됩니다.
+
+        Args:
+            e (int): 비용을 바꿀 간선의 번호 ( 'add_edge'의 반환값 )
+            c (float): 새 비용
+        """
+
+        # 변경 목록에 추가
+        self._pending.append((False, e, c))
+
+    def update_capacity(self, e: int, w: int) -> None:
+        """
+        간선 e의 용량을 w로 바꿉니다. 변경 사항은 다음 'resolve' 호출에서 반영됩니다.
+
+        Args:
+            e (int): 용량을 바꿀 간선의 번호 ( 'add_edge'의 반환값 )
+            w (int): 새 용량
+        """
+
+        # 변경 목록에 추가
+        self._pending.append((True, e, w))
+
+    def resolve(self, s: int, t: int) -> tuple[int, float]:
+        """
+        'update_cost', 'update_capacity'로 바뀐 간선들만 고쳐서 최소 비용 최대 유량을 다시 구하는 함수입니다.
+
+        직전 계산의 흐름과 정점 포텐셜('self.dist')을 그대로 사용합니다. 바뀐 간선 중 축소 비용이 음수가 된 잔여 간선만 포화시키고
+        ( 용량이 흐름보다 작아진 간선은 흐름을 줄이고 ), 그로 인해 생긴 초과 유량과 부족 유량을 포텐셜 위의 Dijkstra로 찾은
+        최단 경로를 따라 맞춥니다. 변경으로 생긴 음수 순환만 없애는 것과 같으므로 처음부터 다시 계산하지 않습니다.
+        마지막으로 s에서 t로 보낼 수 있는 유량이 남아있다면 추가로 보냅니다.
+
+        Args:
+            s (int): 시작 정점
+            t (int): 도착 정점
+
+        Returns:
+            tuple[int, float]: 변경이 반영된 최대 유량과 최소 비용을 담은 튜플
+        """
+
+        # 반복문에서 사용할 배열들을 지역 변수로 가져옴
+        n, to, cap, flow, cost = self.size, self.to, self.cap, self.flow, self.cost
+
+        # 변경 전 그래프에서 유효한 포텐셜
+        h = self._potentials()
+
+        # 각 정점의 초과 유량 ( 음수는 부족 유량 )
+        excess = [0 for _ in range(n)]
+
+        # 변경 사항을 하나씩 반영
+        for is_cap, e, x in self._pending:
+
+            # 용량 변경: 흐름이 새 용량보다 크면 초과분만큼 흐름을 되돌림
+            if is_cap:
+                cap[e] = x
+                if (d := flow[e] - cap[e]) > 0:
+                    flow[e] -= d
+                    flow[e ^ 1] += d
+                    excess[to[e ^ 1]] += d
+                    excess[to[e]] -= d
+
+            # 비용 변경: 정방향과 역방향 간선의 비용을 함께 바꿈
+            else:
+                cost[e], cost[e ^ 1] = x, -x
+
+            # 바뀐 간선과 역방향 간선 중 축소 비용이 음수인 잔여 간선을 포화시킴
+            for a in (e, e ^ 1):
+                if (r := cap[a] - flow[a]) > 0 and cost[a] + h[u := to[a ^ 1]] - h[v := to[a]] < 0:
+                    flow[a] += r
+                    flow[a ^ 1] -= r
+                    excess[v] += r
+                    excess[u] -= r
+        self._pending.clear()
+
+        # s와 t는 유량 보존 조건이 없으므로 불균형에서 제외
+        excess[s] = excess[t] = 0
+
+        # 초과 유량은 가장 가까운 부족 정점이나 s, t로 보내고, 남은 부족 유량은 가장 가까운 s나 t에서 채움
+        for free_source in (False, True):
+            while True:
+
+                # 출발 정점과 도착 정점 표시
+                is_target = [x < 0 for x in excess]
+                if free_source:
+                    sources = [s, t]
+                else:
+                    sources = [v for v in range(n) if excess[v] > 0]
+                    is_target[s] = is_target[t] = True
+                if not sources or not any(is_target):
+                    break
+
+                # 포텐셜 위의 최단 경로 탐색 ( 도달할 수 없으면 중단 )
+                y, pred = self._route(h, sources, is_target)
+                if y == -1:
+                    break
+
+                # 경로를 거슬러 올라가며 보낼 수 있는 양 계산
+                path, v = [], y
+                while (e := pred[v]) != -1:
+                    path.append(e)
+                    v = to[e ^ 1]
+                d = min(cap[e] - flow[e] for e in path)
+                if not free_source:
+                    d = min(d, excess[v])
+                if y != s and y != t:
+                    d = min(d, -excess[y])
+
+                # 경로를 따라 유량을 보내고 불균형 갱신
+                for e in path:
+                    flow[e] += d
+                    flow[e ^ 1] -= d
+                if not free_source:
+                    excess[v] -= d
+                if y != s and y != t:
+                    excess[y] += d
+
+        # 불균형이 해소된 흐름에서 s에서 t로 추가 유량을 보냄
+        self.dist = h
+        while self.dijkstra(s, t):
+            self.last = self.head.tolist()
+            self.blocking_flow(s, t)
+
+        # 바뀐 비용 기준으로 총 비용을 다시 계산
+        self.total_cost = sum(flow[e] * cost[e] for e in range(0, len(to), 2))
+
+        # 전체 유량과 총 비용 반환
+        return self._outflow(s), self.total_cost
+
+    def _potentials(self) -> list[float]:
+        """
+        모든 잔여 간선의 축소 비용이 0 이상이 되는 정점 포텐셜을 반환합니다.
+        직전 계산이 남긴 'self.dist'가 이 조건을 만족하면 그대로 사용하고,
+        그렇지 않으면 ( 도달할 수 없는 정점이 있는 등 ) 모든 정점에서 동시에 시작하는 SPFA로 다시 계산합니다.
+
+        Returns:
+            list[float]: 정점 포텐셜
+        """
+
+        # 반복문에서 사용할 배열들을 지역 변수로 가져옴
+        n, to, cap, flow, cost = self.size, self.to, self.cap, self.flow, self.cost
+
+        # 직전 포텐셜이 유효하면 복사하여 반환
+        h = self.dist
+        if all(x < float('inf') for x in h) and all(
+            cap[e] <= flow[e] or cost[e] + h[to[e ^ 1]] - h[to[e]] >= 0 for e in range(len(to))
+        ):
+            return h[:]
+
+        # 모든 정점의 거리를 0으로 두고 SPFA 수행
+        h = [0 for _ in range(n)]
+        queue, queued = deque(range(n)), [True for _ in range(n)]
+        while queue:
+            u = queue.popleft()
+            queued[u] = False
+            for e in self._edges(u):
+                if cap[e] > flow[e] and h[u] + cost[e] < h[v := to[e]]:
+                    h[v] = h[u] + cost[e]
+                    if not queued[v]:
+                        queued[v] = True
+                        queue.append(v)
+        return h
+
+    def _route(self, h: list[float], sources: list[int], is_target: list[bool]) -> tuple[int, list[int]]:
+        """
+        여러 출발 정점에서 동시에 포텐셜 위의 Dijkstra를 수행하여 가장 가까운 도착 정점을 찾는 함수입니다.
+        도착 정점을 찾으면 포텐셜을 h[v] + min(d[v], d[도착 정점])으로 갱신하여 축소 비용이 음수가 되지 않게 합니다.
+
+        Args:
+            h (list[float]): 정점 포텐셜 ( 함수 안에서 갱신됨 )
+            sources (list[int]): 출발 정점들
+            is_target (list[bool]): 각 정점이 도착 정점인지 여부
+
+        Returns:
+            tuple[int, list[int]]: 찾은 도착 정점( 없으면 -1 )과 각 정점에 도달할 때 사용한 간선 번호 리스트
+        """
+
+        # 반복문에서 사용할 배열들을 지역 변수로 가져옴
+        n, to, cap, flow, cost = self.size, self.to, self.cap, self.flow, self.cost
+
+        # 출발 정점들의 거리를 0으로 두고 힙 초기화
+        d, pred = [float('inf') for _ in range(n)], [-1 for _ in range(n)]
+        for x in sources:
+            d[x] = 0
+        heap = [(0, x) for x in sources]
+        heapify(heap)
+
+        # 가장 먼저 꺼내지는 도착 정점을 찾을 때까지 반복
+        while heap:
+            du, u = heappop(heap)
+            if du > d[u]:
+                continue
+            if is_target[u]:
+                break
+            for e in self._edges(u):
+                if cap[e] > flow[e] and (nd := du + cost[e] + h[u] - h[v := to[e]]) < d[v]:
+                    d[v], pred[v] = nd, e
+                    heappush(heap, (nd, v))
+        else:
+            return -1, pred
+
+        # 포텐셜 갱신
+        for v in range(n):
+            h[v] += min(d[v], du)
+
+        # 도착 정점과 경로 정보 반환
+        return u, pred
+
+    def cost_scaling(self, s: int, t: int, alpha: int = 8) -> tuple[int, int]:
+        """
+        Goldberg-Tarjan의 비용 스케일링(cost scaling) push-relabel 알고리즘으로 최소 비용 최대 유량을 구하는 함수입니다.
+
+        t에서 s로 가는 비용이 매우 작은 ( 모든 비용의 절댓값의 합보다 작은 음수 ) 임시 간선을 붙여 최소 비용 순환 문제로 바꾼 뒤,
+        비용에 (정점 수 + 1)을 곱하고 ε를 alpha로 나눠가며 ε-최적 순환을 다듬습니다 ( refine ).
+        ε가 1이 되면 원래 비용에 대해 최적이므로, 서로 다른 경로 비용의 개수와 무관하게 다항 시간에 끝납니다.
+
+        현재 흐름에서 시작하므로 이미 보낸 유량이 있어도 되며, 이 경우 기존 흐름의 경로도 더 싼 경로로 바뀔 수 있습니다.
+        비용은 모두 정수여야 합니다.
+
+        Args:
+            s (int): 시작 정점
+            t (int): 도착 정점
+            alpha (int, optional): 단계마다 ε를 나누는 값, 기본값은 8
+
+        Returns:
+            tuple[int, int]: 이번 호출에서 늘어난 유량과 총 비용의 변화량을 담은 튜플
+        """
+
+        # 반복문에서 사용할 배열들을 지역 변수로 가져옴
+        n, head, to, cap, flow, nxt = self.size, self.head, self.to, self.cap, self.flow, self.next
+
+        # 임시 간선을 떼어낼 기준이 되는 간선 개수와 호출 전의 유량, 비용
+        m = len(to)
+        before = self._outflow(s)
+        base = sum(flow[e] * self.cost[e] for e in range(0, m, 2))
+
+        # t에서 s로 가는 임시 간선 추가 ( 용량은 s에서 나갈 수 있는 유량의 상한, 흐름은 현재 유량 )
+        e_ts = self.add_edge(t, s, sum(cap[e] for e in self._edges(s)), -(sum(abs(c) for c in self.cost) + 1))
+        flow[e_ts], flow[e_ts ^ 1] = before, -before
+
+        # (정점 수 + 1)배 한 비용과 정점 포텐셜
+        cs = [c * (n + 1) for c in self.cost]
+        p = [0 for _ in range(n)]
+
+        # ε를 최대 비용에서 시작하여 1이 될 때까지 alpha로 나눠가며 다듬기
+        eps = max(map(abs, cs))
+        while eps > 1:
+            eps = max(eps // alpha, 1)
+            self._refine(cs, p, eps)
+
+        # 임시 간선의 흐름이 곧 s에서 t로의 유량
+        after = flow[e_ts]
+
+        # 임시 간선 제거
+        head[s], head[t] = nxt[e_ts ^ 1], nxt[e_ts]
+        for a in (to, cap, flow, self.cost, nxt):
+            del a[m:]
+
+        # 총 비용 갱신
+        delta = sum(flow[e] * self.cost[e] for e in range(0, m, 2)) - base
+        self.total_cost += delta
+
+        # 늘어난 유량과 비용의 변화량 반환
+        return after - before, delta
+
+    def _refine(self, cs: list[int], p: list[int], eps: int) -> None:
+        """
+        현재 순환을 ε-최적 순환으로 다듬는 함수입니다.
+        축소 비용 cs[e] + p[u] - p[v]가 음수인 잔여 간선을 모두 포화시킨 뒤,
+        초과 유량이 있는 정점에서 축소 비용이 음수인 간선으로 밀어내고 ( push ), 밀어낼 간선이 없으면 포텐셜을 낮춥니다 ( relabel ).
+
+        Args:
+            cs (list[int]): 간선별 스케일링된 비용
+            p (list[int]): 정점 포텐셜 ( 함수 안에서 갱신됨 )
+            eps (int): 목표 ε
+        """
+
+        # 반복문에서 사용할 배열들을 지역 변수로 가져옴
+        n, head, to, cap, flow, nxt = self.size, self.head, self.to, self.cap, self.flow, self.next
+
+        # 각 정점의 초과 유량
+        excess = [0 for _ in range(n)]
+
+        # 축소 비용이 음수인 잔여 간선을 모두 포화시킴
+        for e in range(len(to)):
+            if (r := cap[e] - flow[e]) > 0 and cs[e] + p[u := to[e ^ 1]] - p[v := to[e]] < 0:
+                flow[e] += r
+                flow[e ^ 1] -= r
+                excess[v] += r
+                excess[u] -= r
+
+        # 초과 유량이 있는 정점들과 각 정점의 현재 간선
+        active = deque(v for v in range(n) if excess[v] > 0)
+        cur = head.tolist()
+
+        # 초과 유량이 있는 정점이 남아있는 동안 반복
+        while active:
+            u = active.popleft()
+
+            # 초과 유량을 모두 밀어낼 때까지 반복
+            while excess[u] > 0:
+
+                # 현재 간선이 없으면 잔여 간선 중 가장 큰 p[v] - cs[e]보다 ε 낮게 포텐셜을 낮춤 ( relabel )
+                if (e := cur[u]) == -1:
+                    best, e = -float('inf'), head[u]
+                    while e != -1:
+                        if cap[e] > flow[e] and p[to[e]] - cs[e] > best:
+                            best = p[to[e]] - cs[e]
+                        e = nxt[e]
+                    p[u] = best - eps
+                    cur[u] = head[u]
+                    continue
+
+                # 잔여 용량이 있고 축소 비용이 음수인 간선으로 초과 유량을 밀어냄 ( push )
+                if cap[e] > flow[e] and cs[e] + p[u] - p[v := to[e]] < 0:
+                    d = min(excess[u], cap[e] - flow[e])
+                    flow[e] += d
+                    flow[e ^ 1] -= d
+                    excess[u] -= d
+
+                    # 도착 정점이 새로 초과 유량을 갖게 된 경우 목록에 추가
+                    if excess[v] <= 0 < excess[v] + d:
+                        active.append(v)
+                    excess[v] += d
+
+                # 더 밀어낼 수 없는 간선이면 다음 간선으로 이동
+                else:
+                    cur[u] = nxt[e]
+
+    def _edges(self, u: int):
+        """
+        정점 u에서 출발하는 간선 번호들을 차례로 생성합니다.
+
+        Args:
+            u (int): 시작 정점
+
+        Yields:
+            int: 간선 번호
+        """
+
+        e = self.head[u]
+        while e != -1:
+            yield e
+            e = self.next[e]
+
+    def _outflow(self, s: int) -> int:
+        """
+        현재 흐름에서 정점 s로부터 나가는 순유량을 반환합니다.
+
+        Args:
+            s (int): 정점
+
+        Returns:
+            int: 정점 s에서 나가는 순유량
+        """
+
+        # s에서 출발하는 모든 간선의 흐름을 더함 ( 들어오는 흐름은 역방향 간선의 음수 흐름으로 반영됨 )
+        return sum(self.flow[e] for e in self._edges(s))
+
+    def network_simplex(self, supply: list[int]) -> tuple[int, float] | None:
+        """
+        네트워크 심플렉스(network simplex) 알고리즘으로 정점별 공급량과 수요량을 만족하는 최소 비용 유량을 구하는 함수입니다.
+
+        'add_edge'로 추가된 간선들과 인공 루트 정점에 연결된 인공 간선들로 신장 트리 기저를 만들고,
+        간선들을 블록 단위로 훑어 가장 크게 위반하는 간선을 진입 간선으로 고르는 block search 규칙으로 피벗합니다.
+        인공 간선의 비용은 모든 간선 비용의 절댓값의 합보다 크게 두어, 실행 가능한 해가 있다면 인공 간선에 유량이 남지 않습니다.
+
+        경로 하나당 한 단계씩 진행하는 'mcmf'와 달리 공급량이 커도 피벗 횟수가 늘어나지 않으므로, 공급량이 큰 수송 문제에 유리합니다.
+        계산된 유량은 기존 흐름을 덮어쓰며 'self.flow'에 저장됩니다.
+
+        Args:
+            supply (list[int]): 각 정점의 공급량 ( 양수는 공급, 음수는 수요, 합은 0이어야 함 )
+
+        Returns:
+            tuple[int, float] | None: 공급된 총 유량과 최소 비용을 담은 튜플 ( 공급과 수요를 맞출 수 없으면 None )
+        """
+
+        # 공급량과 수요량의 합이 맞지 않는 경우
+        if sum(supply) != 0:
+            return None
+
+        # 정점 수, 실제 간선 수, 인공 루트 정점, 전체 간선 수
+        n, m = self.size, len(self.to) // 2
+        root, arcs = n, m + n
+
+        # 인공 간선의 비용 ( 실제 간선으로 이루어진 어떤 경로의 비용보다 큼 )
+        art = sum(abs(c) for c in self.cost[0::2]) + 1
+
+        # 각 간선의 시작 정점, 도착 정점, 용량, 비용, 흐름 ( 0 ~ m - 1: 실제 간선, m + v: 정점 v의 인공 간선 )
+        src = self.to[1::2].tolist() + [0 for _ in range(n)]
+        dst = self.to[0::2].tolist() + [0 for _ in range(n)]
+        cap = self.cap[0::2].tolist() + [float('inf') for _ in range(n)]
+        cost = self.cost[0::2] + [art for _ in range(n)]
+        flow = [0 for _ in range(arcs)]
+
+        # 트리 밖 간선의 상태 ( 1: 하한에 있음, -1: 상한에 있음, 0: 트리 간선 )
+        state = [1 for _ in range(m)] + [0 for _ in range(n)]
+
+        # 트리에서 각 정점의 부모, 부모로 가는 간선, 깊이, 포텐셜과 정점별 트리 간선 집합
+        parent = [root for _ in range(n)] + [-1]
+        pred = [m + v for v in range(n)] + [-1]
+        depth = [1 for _ in range(n)] + [0]
+        pot = [0 for _ in range(n + 1)]
+        tree = [{m + v} for v in range(n)] + [set(range(m, arcs))]
+
+        # 공급 정점은 루트로, 수요 정점은 루트에서 인공 간선으로 연결한 초기 기저 구성
+        # ( 흐름이 0인 인공 간선은 루트에서 나가는 방향으로 두어 strongly feasible 트리를 유지 )
+        for v in range(n):
+            a = m + v
+            if supply[v] > 0:
+                src[a], dst[a], flow[a], pot[v] = v, root, supply[v], -art
+            else:
+                src[a], dst[a], flow[a], pot[v] = root, v, -supply[v], art
 
-            # 마지막 방문한 간선 배열 초기화
-            self.last = [0 for _ in range(self.size)]
+        # 한 번에 훑을 블록의 크기와 다음 탐색을 시작할 간선
+        block, start = max(int(arcs ** 0.5), 10), 0
 
-            # 시작 노드에서 도착 노드까지의 경로를 찾고 유량을 계산하여 f에 저장
-            while f := self.dfs(s, t):
+        while True:
 
-                # 최대 유량 업데이트
-                mf += f
+            # 블록 단위로 축소 비용 조건을 가장 크게 위반하는 진입 간선 탐색
+            enter, best, cnt, a = -1, 0, 0, start
+            for _ in range(arcs):
+                if state[a] and (c := state[a] * (cost[a] + pot[src[a]] - pot[dst[a]])) < best:
+                    enter, best = a, c
+                cnt += 1
+                a = a + 1 if a + 1 < arcs else 0
+                if cnt == block:
+                    if enter != -1:
+                        break
+                    cnt = 0
 
-                # 최소 비용 업데이트
-                mc = min(mc, self.total_cost)
+            # 위반하는 간선이 없으면 최적해
+            if enter == -1:
+                break
+            start = a
 
-        # 최대 유량과 최소 비용 반환
-        return mf, mc
+            # 진입 간선으로 유량을 보내는 방향 ( first에서 second로 )
+            first, second = (src[enter], dst[enter]) if state[enter] == 1 else (dst[enter], src[enter])
+
+            # 두 정점의 최소 공통 조상 ( join ) 탐색
+            u, v = first, second
+            while u != v:
+                if depth[u] >= depth[v]:
+                    u = parent[u]
+                else:
+                    v = parent[v]
+            join = u
+
+            # join에서 first로 내려가는 경로와 second에서 join으로 올라가는 경로의 정점들
+            down, w = [], first
+            while w != join:
+                down.append(w)
+                w = parent[w]
+            down.reverse()
+            up, w = [], second
+            while w != join:
+                up.append(w)
+                w = parent[w]
+
+            # 순환을 join에서부터 진행 방향으로 돌며 잔여 용량이 최소인 마지막 간선을 나가는 간선으로 선택
+            delta, leaving, leave_first = float('inf'), -1, False
+            for w in down:
+                a = pred[w]
+                if (r := cap[a] - flow[a] if src[a] == parent[w] else flow[a]) <= delta:
+                    delta, leaving, leave_first = r, a, True
+            if cap[enter] <= delta:
+                delta, leaving = cap[enter], enter
+            for w in up:
+                a = pred[w]
+                if (r := cap[a] - flow[a] if src[a] == w else flow[a]) <= delta:
+                    delta, leaving, leave_first = r, a, False
+
+            # 순환을 따라 유량 갱신
+            if delta:
+                flow[enter] += delta if state[enter] == 1 else -delta
+                for w in down:
+                    a = pred[w]
+                    flow[a] += delta if src[a] == parent[w] else -delta
+                for w in up:
+                    a = pred[w]
+                    flow[a] += delta if src[a] == w else -delta
+
+            # 진입 간선이 그대로 나가는 경우 하한과 상한 상태만 바꿈
+            if leaving == enter:
+                state[enter] = -state[enter]
+                continue
+
+            # 나가는 간선은 트리 밖으로, 진입 간선은 트리 안으로 이동
+            state[enter], state[leaving] = 0, 1 if flow[leaving] == 0 else -1
+            tree[src[leaving]].discard(leaving)
+            tree[dst[leaving]].discard(leaving)
+            tree[src[enter]].add(enter)
+            tree[dst[enter]].add(enter)
+
+            # 떨어져 나간 부분 트리에 속한 진입 간선의 끝 정점 x를 다른 끝 정점 y 아래에 연결
+            x, y = (first, second) if leave_first else (second, first)
+            parent[x], pred[x], depth[x] = y, enter, depth[y] + 1
+            pot[x] = pot[y] + cost[enter] if src[enter] == y else pot[y] - cost[enter]
+
+            # x를 루트로 부분 트리의 부모, 깊이, 포텐셜 재계산
+            stack = [x]
+            while stack:
+                w = stack.pop()
+                for a in tree[w]:
+                    if a != pred[w]:
+                        o = dst[a] if src[a] == w else src[a]
+                        parent[o], pred[o], depth[o] = w, a, depth[w] + 1
+                        pot[o] = pot[w] + cost[a] if src[a] == w else pot[w] - cost[a]
+                        stack.append(o)
+
+        # 인공 간선에 유량이 남은 경우 공급과 수요를 맞출 수 없음
+        if any(flow[m:]):
+            return None
+
+        # 계산된 유량을 간선 배열에 저장
+        for i in range(m):
+            self.flow[2 * i], self.flow[2 * i + 1] = flow[i], -flow[i]
+
+        # 총 비용 계산 및 저장
+        self.total_cost = sum(f * c for f, c in zip(flow[:m], cost))
+
+        # 공급된 총 유량과 최소 비용 반환
+        return sum(x for x in supply if x > 0), self.total_cost
+
+    def dijkstra(self, s: int, t: int) -> bool:
+        """
+        'self.dist'를 정점 포텐셜로 사용하여, 축소 비용 cost(u, v) + dist[u] - dist[v] 위에서 힙 기반 Dijkstra를 수행하는 함수입니다.
+        직전 단계의 최단 거리로 만든 포텐셜에서는 잔여 간선의 축소 비용이 모두 0 이상이므로 음수 간선 없이 최단 경로를 구할 수 있습니다.
+
+        탐색 후 포텐셜을 dist[v] + min(d[v], d[t])로 갱신하므로, 'self.dist'는 SPFA와 마찬가지로
+        최단 경로 위의 간선에서 dist[v] == dist[u] + cost(u, v)를 만족하여 'dfs'를 그대로 사용할 수 있습니다.
+
+        Args:
+            s (int): 시작 정점
+            t (int): 도착 정점
+
+        Returns:
+            bool: 시작 정점부터 도착 정점까지의 최단 경로가 존재하는지 여부
+        """
+
+        # 정점 포텐셜
+        h = self.dist
+
+        # 축소 비용 기준 거리 ( 시작 노드의 거리는 0 )
+        d = [float('inf') for _ in range(self.size)]
+        d[s] = 0
+
+        # 탐색할 노드를 저장할 최소 힙
+        heap = [(0, s)]
+
+        # 힙이 빌 때까지 반복
+        while heap:
+
+            # 현재까지의 거리가 가장 짧은 노드를 꺼냄
+            du, u = heappop(heap)
+
+            # 이미 더 짧은 거리로 방문한 경우 무시
+            if du > d[u]:
+                continue
+
+            # 해당 노드에서 출발하는 모든 간선에 대해 반복
+            e = self.head[u]
+            while e != -1:
+
+                # 잔여 용량이 있는 경우 축소 비용으로 거리 갱신
+                if self.flow[e] < self.cap[e] and (nd := du + self.cost[e] + h[u] - h[v := self.to[e]]) < d[v]:
+                    d[v] = nd
+                    heappush(heap, (nd, v))
+
+                # 다음 간선으로 이동
+                e = self.next[e]
+
+        # 도착 노드에 도달할 수 없는 경우
+        if d[t] == float('inf'):
+            return False
+
+        # 포텐셜 갱신 ( 도착 노드보다 먼 노드는 도착 노드까지의 거리만큼만 올려 축소 비용이 음수가 되지 않게 함 )
+        self.dist = [h[v] + min(d[v], d[t]) for v in range(self.size)]
+
+        # 최단 경로가 존재함을 반환
+        return True
 
     def spfa(self, s: int, t: int) -> bool:
         """
@@ -139,14 +888,18 @@ class MCMF:
             # 해당 노드를 방문하지 않았음으로 표시
             self.visited[u] = False
 
-            # 해당 노드와 연결된 모든 간선에 대해 반복
-            for v in self.adj[u]:
+            # 해당 노드에서 출발하는 모든 간선에 대해 반복
+            e = self.head[u]
+            while e != -1:
+
+                # 간선의 도착 노드
+                v = self.to[e]
 
                 # 잔여 용량이 있으며, v로 이동하는 것이 경로의 비용을 더 줄일 수 있는 경우
-                if self.flow[u][v] < self.cap[u][v] and self.dist[v] > self.dist[u] + self.cost[u][v]:
+                if self.flow[e] < self.cap[e] and self.dist[v] > self.dist[u] + self.cost[e]:
 
                     # 거리 업데이트
-                    self.dist[v] = self.dist[u] + self.cost[u][v]
+                    self.dist[v] = self.dist[u] + self.cost[e]
 
                     # 해당 노드를 방문하지 않은 경우
                     if not self.visited[v]:
@@ -157,9 +910,103 @@ class MCMF:
                         # 큐에 추가
                         queue.append(v)
 
+                # 다음 간선으로 이동
+                e = self.next[e]
+
         # 도착 노드까지의 최단 경로가 존재하는지 여부 반환
         return self.dist[t] < float('inf')
 
+    def blocking_flow(self, s: int, t: int, limit: int=float('inf')) -> int:
+        """
+        명시적 스택을 사용하여 최단 경로 DAG( dist[v] == dist[u] + cost(e)인 잔여 간선 )의 blocking flow를 구하는 함수입니다.
+
+        재귀 없이 s에서부터 경로를 확장하며, t에 도달하면 경로 상의 최소 잔여 용량만큼 유량을 보낸 뒤
+        처음으로 포화된 간선의 시작 정점까지만 후퇴하여 다음 경로를 이어서 탐색합니다.
+        'self.last'를 각 정점의 현재 간선으로 사용하여, 막다른 간선이나 이미 경로 위에 있는 정점으로 가는 간선은
+        이번 단계에서 다시 보지 않습니다. 비용이 0인 순환이 있어도 경로 위의 정점은 'self.visited'로 표시되어 다시 들어가지 않습니다.
+        'spfa' 또는 'dijkstra'로 'self.dist'를, 'self.head'로 'self.last'를 미리 초기화해 두어야 합니다.
+
+        Args:
+            s (int): 시작 정점
+            t (int): 도착 정점
+            limit (int, optional): 이번 단계에서 보낼 유량의 상한, 기본값은 INF
+
+        Returns:
+            int: 이번 단계에서 보낸 유량
+        """
+
+        # 반복문에서 사용할 배열들을 지역 변수로 가져옴
+        to, cap, flow, cost, nxt = self.to, self.cap, self.flow, self.cost, self.next
+        dist, last, visited = self.dist, self.last, self.visited
+
+        # 이번 단계에서 보낸 유량
+        pushed = 0
+
+        # s에서 현재 정점까지의 경로를 이루는 간선 번호 스택
+        path = []
+
+        # 현재 정점
+        u = s
+        visited[s] = True
+
+        while pushed < limit:
+
+            # 도착 노드에 도달한 경우
+            if u == t:
+
+                # 경로 상의 최소 잔여 용량과 남은 상한 중 작은 값만큼 유량을 보냄
+                f = min(limit - pushed, min(cap[e] - flow[e] for e in path))
+                for e in path:
+                    flow[e] += f
+                    flow[e ^ 1] -= f
+
+                # 총 비용과 보낸 유량 갱신
+                self.total_cost += f * sum(cost[e] for e in path)
+                pushed += f
+
+                # 상한만큼 보냈으면 종료
+                if pushed >= limit:
+                    break
+
+                # 처음으로 포화된 간선의 위치를 찾아 그 시작 정점까지 후퇴
+                i = next(i for i, e in enumerate(path) if flow[e] == cap[e])
+                for e in path[i:]:
+                    visited[to[e]] = False
+                del path[i:]
+                u = to[path[-1]] if path else s
+                continue
+
+            # 현재 정점에서 최단 경로 DAG 위의 잔여 용량이 있는 간선을 찾을 때까지 다음 간선으로 이동
+            e = last[u]
+            while e != -1 and (visited[v := to[e]] or flow[e] == cap[e] or dist[v] != dist[u] + cost[e]):
+                e = nxt[e]
+            last[u] = e
+
+            # 진행할 간선이 있는 경우 경로를 확장
+            if e != -1:
+                path.append(e)
+                u = to[e]
+                visited[u] = True
+
+            # 막다른 정점인데 시작 정점인 경우 blocking flow 완성
+            elif u == s:
+                break
+
+            # 막다른 정점인 경우 직전 정점으로 후퇴하고, 직전 정점의 간선을 다음 간선으로 이동
+            else:
+                visited[u] = False
+                e = path.pop()
+                u = to[e ^ 1]
+                last[u] = nxt[e]
+
+        # 경로 위에 남은 정점들의 방문 표시 해제
+        visited[s] = False
+        for e in path:
+            visited[to[e]] = False
+
+        # 보낸 유량 반환
+        return pushed
+
     def dfs(self, u: int, t: int, f: int=float('inf')) -> int:
         """
         Depth First Search (DFS)를 이용하여 시작 정점부터 도착 정점까지의 경로를 찾고 유량을 계산하는 함수입니다.
@@ -182,32 +1029,39 @@ class MCMF:
         # 해당 노드를 방문했음을 표시
         self.visited[u] = True
 
-        # 해당 노드의 모든 인접한 간선에 대해 반복
-        for v in self.adj[u][self.last[u]:len(self.adj[u])]:
+        # 해당 노드의 마지막으로 방문한 간선부터 모든 간선에 대해 반복
+        e = self.last[u]
+        while e != -1:
+
+            # 간선의 도착 노드
+            v = self.to[e]
 
             # 노드 v가 아직 방문되지 않았고, 잔여 용량이 있으며, v로 이동하는 것이 현재까지의 최단 경로의 비용을 유지할 수 있는 경우
-            if not self.visited[v] and self.flow[u][v] < self.cap[u][v] and self.dist[v] == self.dist[u] + self.cost[u][v]:
+            if not self.visited[v] and self.flow[e] < self.cap[e] and self.dist[v] == self.dist[u] + self.cost[e]:
 
                 # 재귀적으로 경로를 찾고 유량을 계산
-                pushed = self.dfs(v, t, min(f, self.cap[u][v] - self.flow[u][v]))
+                pushed = self.dfs(v, t, min(f, self.cap[e] - self.flow[e]))
 
                 # 유량을 보낼 수 있는 경우
                 if pushed:
                     
                     # 총 비용 업데이트
-                    self.total_cost += pushed * self.cost[u][v]
+                    self.total_cost += pushed * self.cost[e]
 
                     # 유량 추가
-                    self.flow[u][v] += pushed
+                    self.flow[e] += pushed
 
                     # 역방향 간선의 유량 제거
-                    self.flow[v][u] -= pushed
+                    self.flow[e ^ 1] -= pushed
 
                     # 해당 노드를 방문하지 않은 상태로 변경
                     self.visited[u] = False
 
                     # 유량 반환
                     return pushed
+
+            # 다음 간선으로 이동
+            e = self.next[e]
                 
         # 해당 노드를 방문하지 않은 상태로 변경
         self.visited[u] = False
@@ -1,18 +1,33 @@
+from array import array
 from collections import deque
+from itertools import chain
+from typing import Iterator
 class MF:
     def __init__(self, v: int):
 
         # v개의 정점을 가진 최대 유량 그래프 초기화
         self.size = v
 
-        # 그래프의 인접 리스트
-        self.adj = [[] for _ in range(v)]
+        # 각 정점에서 마지막으로 추가된 간선의 번호를 저장하는 배열 ( 간선이 없으면 -1 )
+        self.head = array('i', [-1]) * v
 
-        # 용량을 저장하는 인접 리스트
-        self.cap = [[0 for _ in range(v)] for _ in range(v)]
+        # 간선의 도착 정점을 저장하는 배열
+        self.to = array('i')
 
-        # 흐름을 저장하는 인접 리스트
-        self.flow = [[0 for _ in range(v)] for _ in range(v)]
+        # 간선의 용량을 저장하는 배열
+        self.cap = array('q')
+
+        # 간선의 흐름을 저장하는 배열
+        self.flow = array('q')
+
+        # 같은 정점에서 출발하는 다음 간선의 번호를 저장하는 배열 ( 마지막 간선이면 -1 )
+        self.next = array('i')
+
+        # 간선의 유량 하한을 저장하는 배열 ( cap과 flow는 하한을 뺀 값으로 저장됨 )
+        self.low = array('q')
+
+        # 각 정점에 들어오는 하한의 합에서 나가는 하한의 합을 뺀 값
+        self.demand = [0 for _ in range(v)]
 
         # 각 노드까지의 거리를 저장하는 리스트
         self.depth = [0 for _ in range(v)]
@@ -20,39 +35,401 @@ class MF:
         # 각 노드의 마지막으로 방문한 간선을 저장하는 리스트
         self.last = [0 for _ in range(v)]
 
-    def add_edge(self, u: int, v: int, c: int, d: bool=True):
+    def add_edge(self, u: int, v: int, c: int, d: bool=True, l: int=0) -> int:
         """
         정점 'u'에서 정점 'v'로 용량 'c'를 갖는 간선을 추가합니다.
-        이 메소드는 간선을 그래프에 추가하고 간선 리스트 'edges'에 저장합니다.
-        양방향 간선일 경우 'd'를 False로 설정하여 역방향 간선도 추가합니다.
+        정방향 간선은 짝수 번호 e, 역방향 간선은 e ^ 1 번호로 쌍을 이루어 저장됩니다.
+        양방향 간선일 경우 'd'를 False로 설정하여 역방향 간선에도 용량을 부여합니다.
+        유량을 계산한 뒤에도 간선을 추가할 수 있으며, 기존 흐름은 그대로 유지됩니다.
+        유량 하한 'l'이 있는 간선은 용량 c - l의 간선으로 저장되고, 하한은 'feasible_circulation'과
+        'max_flow_with_lower_bounds'에서 반영됩니다.
 
         Args:
             u (int): 간선의 시작 정점
             v (int): 간선의 도착 정점
             c (int): 간선의 용량
             d (bool, optional): 간선의 방향성 여부, 기본값은 True (단방향 간선)
+            l (int, optional): u에서 v 방향으로 반드시 흘러야 하는 유량의 하한, 기본값은 0
+
+        Returns:
+            int: 추가된 정방향 간선의 번호
+        """
+
+        # 새로 추가될 정방향 간선의 번호
+        e = len(self.to)
+
+        # u에서 v로 가는 간선 추가 ( 하한을 뺀 용량 저장 )
+        self.to.append(v)
+        self.cap.append(c - l)
+        self.flow.append(0)
+        self.low.append(l)
+        self.next.append(self.head[u])
+        self.head[u] = e
+
+        # v에서 u로 가는 간선 추가 ( 양방향일 경우 반대 간선의 용량도 저장 )
+        self.to.append(u)
+        self.cap.append(0 if d else c)
+        self.flow.append(0)
+        self.low.append(0)
+        self.next.append(self.head[v])
+        self.head[v] = e ^ 1
+
+        # 하한이 있는 경우 양 끝 정점의 하한 차이 갱신
+        if l:
+            self.demand[v] += l
+            self.demand[u] -= l
+
+        # 정방향 간선의 번호 반환
+        return e
+
+    @classmethod
+    def from_arrays(cls, n: int, us, vs, caps) -> 'MF':
+        """
+        간선들의 시작 정점, 도착 정점, 용량 배열로부터 최대 유량 그래프를 한 번에 구성합니다.
+        'add_edge'를 간선마다 호출하는 대신 간선 배열을 슬라이스 대입으로 채우므로, 간선이 많은 그래프를 빠르게 만들 수 있습니다.
+        만들어진 그래프는 같은 순서로 'add_edge'를 호출한 것과 동일하며, i번째 간선의 번호는 2 * i입니다.
+
+        Args:
+            n (int): 정점의 수
+            us: 간선의 시작 정점 배열 ( list, array('q'), NumPy 배열 등 )
+            vs: 간선의 도착 정점 배열
+            caps: 간선의 용량 배열
+
+        Returns:
+            MF: 간선이 모두 추가된 최대 유량 그래프
+        """
+
+        # 빈 그래프 생성
+        g = cls(n)
+
+        # 입력을 간선 배열과 같은 타입의 array로 변환
+        us, vs, caps = cls._as_array('i', us), cls._as_array('i', vs), cls._as_array('q', caps)
+
+        # 간선 쌍의 개수의 두 배만큼 간선 배열 할당
+        m = 2 * len(caps)
+        g.to, g.cap, g.flow, g.next = array('i', [0]) * m, array('q', [0]) * m, array('q', [0]) * m, array('i', [0]) * m
+        g.low = array('q', [0]) * m
+
+        # 정방향 간선은 짝수 번호, 역방향 간선은 홀수 번호에 채움
+        g.to[0::2], g.to[1::2] = vs, us
+        g.cap[0::2] = caps
+
+        # 간선 번호 순서대로 각 정점의 간선 연결 리스트 구성 ( 간선 e의 시작 정점은 to[e ^ 1] )
+        head, to, nxt = g.head, g.to, g.next
+        for e in range(m):
+            u = to[e ^ 1]
+            nxt[e] = head[u]
+            head[u] = e
+
+        # 구성된 그래프 반환
+        return g
+
+    @staticmethod
+    def _as_array(typecode: str, values) -> array:
+        """
+        주어진 값들을 지정한 타입의 array로 변환합니다.
+        이미 같은 타입의 array라면 그대로 반환하고, NumPy 배열처럼 'tolist'를 지원하는 객체는 한 번에 변환합니다.
+
+        Args:
+            typecode (str): 변환할 array의 타입 코드
+            values: 변환할 값들
+
+        Returns:
+            array: 변환된 배열
+        """
+
+        # 같은 타입의 array는 복사하지 않음
+        if isinstance(values, array) and values.typecode == typecode:
+            return values
+
+        # tolist를 지원하면 파이썬 리스트로 바꾼 뒤 변환
+        return array(typecode, values.tolist() if hasattr(values, 'tolist') else values)
+
+    def increase_capacity(self, e: int, c: int) -> None:
+        """
+        간선 'e'의 용량을 'c'만큼 늘립니다.
+        현재 흐름은 그대로 유지되므로, 이후 'resume'으로 늘어난 용량만큼만 추가로 유량을 보낼 수 있습니다.
+
+        Args:
+            e (int): 용량을 늘릴 간선의 번호 ( 'add_edge'의 반환값, 역방향은 e ^ 1 )
+            c (int): 늘릴 용량 ( 0 이상 )
+        """
+
+        # 간선의 용량 증가
+        self.cap[e] += c
+
+    def reset(self) -> None:
+        """
+        모든 간선의 흐름을 0으로 되돌립니다.
+        간선 배열은 새로 만들지 않고 그대로 재사용하므로, 같은 그래프에서 여러 번 유량을 계산할 때 사용합니다.
+        """
+
+        # 흐름 배열을 같은 객체 안에서 0으로 덮어씀
+        self.flow[:] = array('q', [0]) * len(self.flow)
+
+    def resume(self, s: int, t: int, algorithm: str = "dinic") -> int:
+        """
+        현재의 흐름에서 시작하여 s에서 t로 추가 유량을 보내고, 전체 유량을 반환합니다.
+        간선 추가나 용량 증가 이후에도 기존 흐름은 여전히 유효하므로,
+        새 그래프를 만들어 처음부터 계산하지 않고 변경된 부분만큼만 증가 경로를 찾습니다.
+
+        Args:
+            s (int): 최대 유량의 시작 정점
+            t (int): 최대 유량의 도착 정점
+            algorithm (str, optional): "dinic" 또는 "hlpp", 기본값은 "dinic"
+
+        Returns:
+            int: 기존 흐름을 포함한 s에서 t로의 최대 유량
+        """
+
+        # 기존 흐름에 이어서 추가 유량을 보냄
+        self.max_flow(s, t, algorithm)
+
+        # s에서 나가는 순유량이 전체 유량
+        return self.flow_value(s)
+
+    def flow_value(self, s: int) -> int:
+        """
+        현재 흐름에서 정점 's'로부터 나가는 순유량을 반환합니다.
+
+        Args:
+            s (int): 유량의 시작 정점
+
+        Returns:
+            int: 정점 s에서 나가는 순유량
+        """
+
+        # s에서 출발하는 모든 간선의 흐름과 하한을 더함 ( 들어오는 흐름은 역방향 간선의 음수 흐름과 정방향 간선의 하한으로 반영됨 )
+        f, e = 0, self.head[s]
+        while e != -1:
+            f += self.flow[e] + self.low[e] - self.low[e ^ 1]
+            e = self.next[e]
+        return f
+
+    def feasible_circulation(self) -> bool:
+        """
+        모든 간선의 유량 하한을 만족하는 순환( circulation )이 존재하는지 확인하고, 존재한다면 현재 흐름을 그 순환으로 만듭니다.
+        임시 슈퍼 소스와 슈퍼 싱크를 같은 간선 배열 뒤에 붙여 최대 유량을 계산한 뒤 다시 떼어내므로 그래프를 복사하지 않습니다.
+        실제 간선의 흐름은 flow[e] + low[e]이며, False를 반환한 경우 현재 흐름은 유효하지 않습니다.
+
+        Returns:
+            bool: 하한을 만족하는 순환의 존재 여부
+        """
+
+        return self._satisfy_lower_bounds()
+
+    def max_flow_with_lower_bounds(self, s: int, t: int) -> int | None:
+        """
+        모든 간선의 유량 하한을 만족하면서 s에서 t로 보낼 수 있는 최대 유량을 계산합니다.
+        s와 t를 잇는 무한 용량 양방향 간선을 임시로 붙인 순환 문제로 하한을 먼저 만족시킨 뒤,
+        임시 간선을 떼어내고 남은 잔여 그래프에서 Dinic으로 유량을 더 보냅니다.
+
+        Args:
+            s (int): 최대 유량의 시작 정점
+            t (int): 최대 유량의 도착 정점
+
+        Returns:
+            int | None: 하한을 만족하는 최대 유량 ( 하한을 만족할 수 없으면 None )
+        """
+
+        # 임시 간선을 떼어낼 기준이 되는 간선 개수
+        m = len(self.to)
+
+        # t와 s를 잇는 임시 양방향 간선 추가 ( 모든 용량과 하한의 합이면 어떤 유량도 막지 않음 )
+        self.add_edge(t, s, min(sum(self.cap) + sum(self.low), (1 << 63) - 1), False)
+
+        # 하한을 만족시키고 임시 간선 제거
+        feasible = self._satisfy_lower_bounds()
+        self._truncate(m)
+
+        # 하한을 만족할 수 없는 경우 None 반환
+        if not feasible:
+            return None
+
+        # 하한을 만족하는 흐름에서 s에서 t로 추가 유량을 보낸 뒤 전체 유량 반환
+        self.dinic(s, t)
+        return self.flow_value(s)
+
+    def _satisfy_lower_bounds(self) -> bool:
+        """
+        임시 슈퍼 소스 S = n과 슈퍼 싱크 T = n + 1을 추가하고, 하한 때문에 부족하거나 남는 유량을 S, T와 잇는 간선으로 보충하여
+        S에서 T로의 최대 유량이 모든 보충 간선을 포화시키는지 확인합니다. 계산 후 임시 정점과 간선은 모두 제거됩니다.
+
+        Returns:
+            bool: 모든 정점에서 하한을 포함한 유량 보존이 성립하는지 여부
+        """
+
+        # 반복문에서 사용할 배열들을 지역 변수로 가져옴
+        n, to, flow = self.size, self.to, self.flow
+
+        # 각 정점이 하한을 맞추기 위해 추가로 내보내야 하는 유량 ( 현재 흐름을 반영 )
+        need = self.demand[:]
+        for e in range(len(to)):
+            need[to[e ^ 1]] -= flow[e]
+
+        # 임시 슈퍼 소스와 슈퍼 싱크 추가
+        m, S, T = len(to), n, n + 1
+        self.head.extend((-1, -1))
+        self.size = n + 2
+
+        # 내보내야 하는 유량은 S에서 공급하고, 받아야 하는 유량은 T로 흘려보냄
+        total = 0
+        for v in range(n):
+            if need[v] > 0:
+                self.add_edge(S, v, need[v])
+                total += need[v]
+            elif need[v] < 0:
+                self.add_edge(v, T, -need[v])
+
+        # 모든 보충 간선이 포화되는지 확인
+        feasible = self.dinic(S, T) == total
+
+        # 임시 간선과 정점 제거
+        self._truncate(m)
+        del self.head[n:]
+        self.size = n
+        self.depth = self.depth[:n]
+
+        return feasible
+
+    def _truncate(self, m: int) -> None:
+        """
+        번호가 m 이상인 간선들을 제거합니다.
+        제거할 간선들은 가장 마지막에 추가된 간선들이므로, 역순으로 각 정점의 첫 번째 간선을 되돌리면 연결 리스트가 복원됩니다.
+
+        Args:
+            m (int): 남길 간선의 개수
+        """
+
+        # 마지막 간선부터 시작 정점의 첫 번째 간선을 이전 간선으로 되돌림
+        for e in range(len(self.to) - 1, m - 1, -1):
+            self.head[self.to[e ^ 1]] = self.next[e]
+
+        # 간선 배열에서 제거
+        for a in (self.to, self.cap, self.flow, self.low, self.next):
+            del a[m:]
+
+    def decompose(self, s: int, t: int) -> Iterator[tuple[list[int], int]]:
+        """
+        현재 흐름을 s에서 t로 가는 경로들과 순환들로 분해하여 (정점 리스트, 유량) 쌍을 하나씩 생성합니다.
+        먼저 s에서 흐름이 있는 간선을 따라 t까지의 경로를 찾아 내보내고, 남은 흐름은 순환으로 내보냅니다.
+        순환은 시작 정점과 마지막 정점이 같은 정점 리스트로 표현됩니다.
+        제너레이터이므로 모든 경로를 한 번에 만들지 않고 필요한 만큼만 꺼내 쓸 수 있으며, 'self.flow'는 변경하지 않습니다.
+
+        Args:
+            s (int): 유량의 시작 정점
+            t (int): 유량의 도착 정점
+
+        Yields:
+            tuple[list[int], int]: 경로( 또는 순환 )를 이루는 정점 리스트와 그 경로로 흐르는 유량
         """
 
-        # u에서 v로 가는 간선 추가
-        self.adj[u].append(v)
+        # 반복문에서 사용할 배열들을 지역 변수로 가져옴
+        to, nxt = self.to, self.next
+
+        # 아직 분해되지 않은 하한을 포함한 흐름 ( 양수인 간선만 흐름이 있는 간선 )
+        rem = array('q', [f + l for f, l in zip(self.flow, self.low)])
+
+        # 각 정점에서 흐름이 남아있을 수 있는 첫 번째 간선
+        cur = self.head.tolist()
+
+        # s에서 t로 가는 경로를 먼저 분해한 뒤, 모든 정점에서 남은 순환을 분해
+        for r, stop in chain(((s, t),), ((v, -1) for v in range(self.size))):
+
+            # 현재 경로의 정점들, 간선들, 경로 상 정점의 위치
+            path, edges, pos, u = [r], [], {r: 0}, r
+
+            while True:
+
+                # 흐름이 남아있는 간선을 찾을 때까지 다음 간선으로 이동
+                e = cur[u]
+                while e != -1 and rem[e] <= 0:
+                    e = nxt[e]
+                cur[u] = e
+
+                # 도착 정점에서 더 나가는 흐름이 없는 경우 경로 상의 최소 흐름만큼 분해하여 내보냄
+                # ( 도착 정점에서 나가는 흐름이 남아있다면 아래에서 순환으로 먼저 분해됨 )
+                if u == stop and e == -1:
+                    f = min(rem[e] for e in edges)
+                    for e in edges:
+                        rem[e] -= f
+                    yield path, f
+
+                    # 다시 시작 정점에서 새 경로 탐색
+                    path, edges, pos, u = [r], [], {r: 0}, r
+                    continue
+
+                # 더 이상 나가는 흐름이 없으면 이 정점에서의 분해를 마침
+                if e == -1:
+                    break
+
+                # 이미 경로 상에 있는 정점으로 돌아온 경우 순환을 분해하여 내보냄
+                if (v := to[e]) in pos:
+                    i = pos[v]
+                    cycle = edges[i:] + [e]
+                    f = min(rem[e] for e in cycle)
+                    for e in cycle:
+                        rem[e] -= f
+                    yield path[i:] + [v], f
+
+                    # 경로를 순환의 시작 정점까지 되돌림
+                    for w in path[i + 1:]:
+                        del pos[w]
+                    del path[i + 1:], edges[i:]
+
+                # 그렇지 않으면 경로를 확장
+                else:
+                    pos[v] = len(path)
+                    path.append(v)
+                    edges.append(e)
+                u = v
+
+    def min_cut(self, s: int) -> array:
+        """
+        최대 유량을 계산한 뒤, 최소 컷에서 s 쪽에 속하는 정점들을 반환합니다.
+        유량 계산의 마지막 BFS가 남긴 'self.depth'를 그대로 사용하므로 그래프를 다시 탐색하지 않습니다.
+        'dinic', 'hlpp', 'max_flow', 'resume' 중 하나를 s에서 호출한 직후에 사용해야 합니다.
 
-        # v에서 u로 가는 간선 추가
-        self.adj[v].append(u)
+        Args:
+            s (int): 최대 유량의 시작 정점
+
+        Returns:
+            array: 잔여 그래프에서 s로부터 도달 가능한 정점 번호 배열
+        """
 
-        # 용량 저장
-        self.cap[u][v] = c
+        # 마지막 BFS가 s에서 시작되지 않은 경우에만 도달 가능한 정점을 다시 계산
+        if self.depth[s] != 0:
+            self.bfs(s, s)
 
-        # 양방향일 경우 반대 간선의 용량도 저장
-        self.cap[v][u] = 0 if d else c
+        # 거리가 기록된 ( 도달 가능한 ) 정점들을 반환
+        return array('i', [v for v, d in enumerate(self.depth) if d != -1])
 
-    def dinic(self, s: int, t: int) -> int:
+    def cut_edges(self) -> array:
+        """
+        마지막 유량 계산이 남긴 'self.depth'를 기준으로 최소 컷을 이루는 간선들을 반환합니다.
+        s 쪽 정점에서 t 쪽 정점으로 향하는 용량이 있는 간선들이며, 모두 포화되어 있고 용량의 합은 최대 유량과 같습니다.
+
+        Returns:
+            array: 최소 컷에 속하는 간선 번호 배열
+        """
+
+        # 반복문에서 사용할 배열들을 지역 변수로 가져옴
+        depth, to, cap = self.depth, self.to, self.cap
+
+        # 시작 정점( to[e ^ 1] )은 도달 가능하고 도착 정점은 도달 불가능한 간선들을 반환
+        return array('i', [e for e in range(len(to)) if cap[e] and depth[to[e ^ 1]] != -1 and depth[to[e]] == -1])
+
+    def dinic(self, s: int, t: int, scaling: bool = False) -> int:
         """
         이 메소드는 Dinic의 알고리즘을 사용하여 최대 유량을 계산합니다.
-        각 반복마다 BFS를 사용하여 증가 경로를 찾고, DFS를 사용하여 유량을 증가시킵니다.
+        각 반복마다 BFS를 사용하여 레벨 그래프를 만들고, 명시적 스택 기반의 blocking flow로 유량을 증가시킵니다.
+        'scaling'이 True이면 잔여 용량이 Δ 이상인 간선만 사용하고 Δ를 절반씩 줄여가는 용량 스케일링을 적용하여,
+        용량의 범위가 넓은 그래프에서 작은 유량만 보내는 단계가 반복되는 것을 막습니다.
 
         Args:
             s (int): 최대 유량의 시작 정점
             t (int): 최대 유량의 도착 정점
+            scaling (bool, optional): 용량 스케일링 사용 여부, 기본값은 False
 
         Returns:
             int: s에서 t로의 최대 유량
@@ -61,22 +438,238 @@ class MF:
         # 최대 유량을 저장할 변수
         mf = 0
 
-        # s에서 t로의 경로가 존재하는 동안 반복
-        while self.bfs(s, t):
+        # 스케일링을 사용하는 경우 Δ를 최대 용량 이하의 가장 큰 2의 거듭제곱으로 설정
+        delta = 1 << max(max(self.cap, default=0).bit_length() - 1, 0) if scaling else 1
+
+        # Δ가 1이 될 때까지 절반씩 줄여가며 반복
+        while delta:
+
+            # 잔여 용량이 Δ 이상인 간선만으로 s에서 t로의 경로가 존재하는 동안 반복
+            while self.bfs(s, t, delta):
 
-            # 각 노드의 마지막 방문한 간선 초기화
-            self.last = [0 for _ in range(self.size)]
+                # 각 노드의 마지막 방문한 간선을 첫 번째 간선으로 초기화
+                self.last = self.head.tolist()
 
-            # s에서 t로의 경로를 찾고, 해당 경로에서의 유량을 계산하여 f에 저장
-            while f := self.dfs(s, t):
+                # 레벨 그래프에서 blocking flow를 구하여 최대 유량에 더함
+                mf += self.blocking_flow(s, t, delta)
 
-                # 최대 유량에 f(해당 경로의 유량)를 더함
-                mf += f
+            # 다음 단계의 Δ
+            delta >>= 1
         
         # 최대 유량 반환
         return mf
 
-    def bfs(self, s: int, t: int) -> bool:
+    def max_flow(self, s: int, t: int, algorithm: str = "dinic") -> int:
+        """
+        이 메소드는 선택한 알고리즘으로 s에서 t로의 최대 유량을 계산합니다.
+        두 알고리즘 모두 'add_edge'로 추가된 같은 간선 배열 위에서 동작하므로, 그래프 형태에 따라 더 빠른 알고리즘을 고를 수 있습니다.
+
+        Args:
+            s (int): 최대 유량의 시작 정점
+            t (int): 최대 유량의 도착 정점
+            algorithm (str, optional): "dinic" 또는 "hlpp", 기본값은 "dinic"
+
+        Returns:
+            int: s에서 t로의 최대 유량
+        """
+
+        # 알고리즘 이름에 해당하는 메소드를 선택하여 실행
+        return {"dinic": self.dinic, "hlpp": self.hlpp}[algorithm](s, t)
+
+    def hlpp(self, s: int, t: int) -> int:
+        """
+        이 메소드는 Highest-Label Push-Relabel(HLPP) 알고리즘을 사용하여 최대 유량을 계산합니다.
+        초과 유량을 가진 정점 중 높이가 가장 높은 정점부터 처리하며,
+        주기적인 전역 재라벨링(global relabeling)과 gap 휴리스틱으로 불필요한 재라벨링을 줄입니다.
+        BFS 단계를 반복하지 않으므로 조밀한 이분 그래프에서 Dinic보다 빠른 경우가 많습니다.
+
+        Args:
+            s (int): 최대 유량의 시작 정점
+            t (int): 최대 유량의 도착 정점
+
+        Returns:
+            int: s에서 t로의 최대 유량
+        """
+
+        # 반복문에서 사용할 배열들을 지역 변수로 가져옴
+        n, head, to, cap, flow, nxt = self.size, self.head, self.to, self.cap, self.flow, self.next
+
+        # 각 정점의 높이와 초과 유량
+        height, excess = [0 for _ in range(n)], [0 for _ in range(n)]
+
+        # 높이별 활성 정점 목록 ( 높이가 바뀐 정점의 오래된 항목은 꺼낼 때 무시 )
+        buckets = [[] for _ in range(2 * n)]
+
+        # 높이별 정점 개수 ( gap 휴리스틱에 사용, 높이가 n 미만인 정점만 셈 )
+        count = [0 for _ in range(2 * n)]
+
+        # 시작 정점에서 나가는 모든 간선을 포화시킴
+        e = head[s]
+        while e != -1:
+            if (r := cap[e] - flow[e]) > 0:
+                flow[e] += r
+                flow[e ^ 1] -= r
+                excess[to[e]] += r
+            e = nxt[e]
+
+        # 전역 재라벨링으로 초기 높이와 활성 정점 목록 구성
+        top = self._global_relabel(s, t, height, excess, count, buckets)
+
+        # 각 정점의 현재 간선
+        cur = head.tolist()
+
+        # 마지막 전역 재라벨링 이후의 재라벨링 횟수
+        relabels = 0
+
+        # 활성 정점이 남아있는 동안 반복
+        while top >= 0:
+
+            # 현재 높이에 활성 정점이 없으면 한 단계 낮은 높이로 이동
+            if not buckets[top]:
+                top -= 1
+                continue
+
+            # 가장 높은 활성 정점을 꺼냄
+            u = buckets[top].pop()
+
+            # 오래된 항목이거나 이미 초과 유량이 없는 경우 무시
+            if height[u] != top or not excess[u]:
+                continue
+
+            # 현재 간선부터 높이가 1 낮은 정점으로 초과 유량을 밀어냄 ( push )
+            hu, e = top, cur[u]
+            while e != -1:
+                if cap[e] > flow[e] and height[v := to[e]] == hu - 1:
+
+                    # 보낼 수 있는 유량
+                    d = min(excess[u], cap[e] - flow[e])
+
+                    # 유량 추가 및 역방향 간선의 유량 제거
+                    flow[e] += d
+                    flow[e ^ 1] -= d
+
+                    # 도착 정점이 새로 활성화된 경우 목록에 추가
+                    if not excess[v] and v != s and v != t:
+                        buckets[hu - 1].append(v)
+
+                    # 초과 유량 갱신
+                    excess[v] += d
+                    excess[u] -= d
+
+                    # 초과 유량을 모두 밀어낸 경우 현재 간선을 유지한 채 종료
+                    if not excess[u]:
+                        break
+
+                # 다음 간선으로 이동
+                e = nxt[e]
+            cur[u] = e
+
+            # 초과 유량을 모두 밀어낸 경우 다음 활성 정점으로 이동
+            if not excess[u]:
+                continue
+
+            # 잔여 용량이 있는 간선 중 가장 낮은 정점보다 1 높게 재라벨링 ( relabel )
+            nh = 2 * n
+            e = head[u]
+            while e != -1:
+                if cap[e] > flow[e] and height[to[e]] + 1 < nh:
+                    nh = height[to[e]] + 1
+                e = nxt[e]
+
+            # 기존 높이의 정점 개수 갱신
+            if hu < n:
+                count[hu] -= 1
+
+                # 기존 높이에 정점이 남지 않은 경우 ( gap ), 그보다 높은 정점들은 t에 도달할 수 없으므로 높이를 n으로 올림
+                if not count[hu]:
+                    for w in range(n):
+                        if hu < height[w] < n:
+                            count[height[w]] -= 1
+                            height[w] = n
+                            if excess[w] and w != s and w != t:
+                                buckets[n].append(w)
+                    nh = max(nh, n)
+
+            # 초과 유량을 보낼 곳이 없는 경우 ( 발생하지 않지만 안전을 위해 ) 해당 정점을 버림
+            if nh >= 2 * n:
+                continue
+
+            # 새 높이 설정 후 다시 활성 정점 목록에 추가
+            height[u] = nh
+            if nh < n:
+                count[nh] += 1
+            cur[u] = head[u]
+            buckets[nh].append(u)
+            top = max(top, nh)
+
+            # 재라벨링이 정점 수만큼 누적되면 전역 재라벨링 수행
+            if (relabels := relabels + 1) >= n:
+                relabels = 0
+                top = self._global_relabel(s, t, height, excess, count, buckets)
+                cur = head.tolist()
+
+        # min_cut에서 사용할 수 있도록 잔여 그래프에서 s로부터 도달 가능한 정점을 계산
+        self.bfs(s, t)
+
+        # 도착 정점에 모인 초과 유량이 최대 유량
+        return excess[t]
+
+    def _global_relabel(self, s: int, t: int, height: list[int], excess: list[int], count: list[int], buckets: list[list[int]]) -> int:
+        """
+        잔여 그래프에서 역방향 BFS를 수행하여 모든 정점의 높이를 정확한 거리로 다시 설정합니다.
+        t에 도달할 수 있는 정점은 t까지의 거리, 그렇지 않은 정점은 n + s까지의 거리를 높이로 가집니다.
+        높이별 정점 개수와 활성 정점 목록도 새 높이에 맞게 다시 구성합니다.
+
+        Args:
+            s (int): 최대 유량의 시작 정점
+            t (int): 최대 유량의 도착 정점
+            height (list[int]): 갱신할 정점별 높이
+            excess (list[int]): 정점별 초과 유량
+            count (list[int]): 갱신할 높이별 정점 개수
+            buckets (list[list[int]]): 갱신할 높이별 활성 정점 목록
+
+        Returns:
+            int: 활성 정점 중 가장 높은 높이 ( 활성 정점이 없으면 -1 )
+        """
+
+        # 반복문에서 사용할 배열들을 지역 변수로 가져옴
+        n, head, to, cap, flow, nxt = self.size, self.head, self.to, self.cap, self.flow, self.next
+
+        # 모든 높이를 도달 불가능한 값으로 초기화
+        for v in range(n):
+            height[v] = 2 * n
+
+        # t에서 시작하여 거리 n을, s에서 시작하여 거리 2n을 넘지 않도록 역방향 BFS 수행
+        for root, base in ((t, 0), (s, n)):
+            height[root] = base
+            queue = deque([root])
+            while queue:
+                u = queue.popleft()
+                e = head[u]
+                while e != -1:
+
+                    # v에서 u로 가는 간선 ( e ^ 1 )에 잔여 용량이 있는 경우 v의 높이 설정
+                    if height[v := to[e]] == 2 * n and cap[e ^ 1] > flow[e ^ 1]:
+                        height[v] = height[u] + 1
+                        queue.append(v)
+                    e = nxt[e]
+
+        # 높이별 정점 개수와 활성 정점 목록 재구성
+        for h in range(2 * n):
+            count[h] = 0
+            buckets[h].clear()
+        top = -1
+        for v in range(n):
+            if height[v] < n:
+                count[height[v]] += 1
+            if excess[v] and v != s and v != t and height[v] < 2 * n:
+                buckets[height[v]].append(v)
+                top = max(top, height[v])
+
+        # 가장 높은 활성 정점의 높이 반환
+        return top
+
+    def bfs(self, s: int, t: int, delta: int = 1) -> bool:
         """
         이 메소드는 BFS를 사용하여 최단 증가 경로를 찾습니다.
         증가 경로가 있는 경우 True를 반환하고, 없는 경우 False를 반환합니다.
@@ -84,6 +677,7 @@ class MF:
         Args:
             s (int): 탐색의 시작 정점
             t (int): 탐색의 목표 정점
+            delta (int, optional): 탐색에 사용할 간선의 최소 잔여 용량, 기본값은 1
 
         Returns:
             bool: 증가 경로의 존재 여부
@@ -101,11 +695,17 @@ class MF:
             # 큐에서 노드 하나를 꺼냄
             u = queue.popleft()
 
+            # 해당 노드에서 출발하는 첫 번째 간선
+            e = self.head[u]
+
             # 해당 노드와 연결된 모든 간선에 대해 반복
-            for v in self.adj[u]:
+            while e != -1:
+
+                # 간선의 도착 노드
+                v = self.to[e]
 
-                # 도착 노드가 아직 방문되지 않았고 잔여 용량이 있는 경우 ( 흐름이 용량보다 작은 경우 )
-                if self.depth[v] == -1 and self.flow[u][v] < self.cap[u][v]:
+                # 도착 노드가 아직 방문되지 않았고 잔여 용량이 delta 이상인 경우
+                if self.depth[v] == -1 and self.cap[e] - self.flow[e] >= delta:
 
                     # 도착 노드의 거리를 업데이트
                     self.depth[v] = self.depth[u] + 1
@@ -113,6 +713,9 @@ class MF:
                     # 큐에 추가
                     queue.append(v)
 
+                # 다음 간선으로 이동
+                e = self.next[e]
+
         # 증가 경로의 존재 여부를 반환
         return self.depth[t] != -1
 
@@ -137,31 +740,107 @@ class MF:
             return f
         
         # 노드 u의 모든 인접한 간선에 대해 반복
-        while self.last[u] < len(self.adj[u]):
+        while (e := self.last[u]) != -1:
 
             # 다음으로 방문할 노드
-            v = self.adj[u][self.last[u]]
+            v = self.to[e]
 
             # 도착 노드가 최단 경로 상에 있고 잔여 용량이 있는 경우 ( 흐름이 용량보다 작은 경우 )
-            if self.depth[v] == self.depth[u] + 1 and self.flow[u][v] < self.cap[u][v]:
+            if self.depth[v] == self.depth[u] + 1 and self.flow[e] < self.cap[e]:
 
                 # 재귀적으로 경로를 찾고 유량을 계산
-                pushed = self.dfs(v, t, min(f, self.cap[u][v] - self.flow[u][v]))
+                pushed = self.dfs(v, t, min(f, self.cap[e] - self.flow[e]))
 
                 # 유량을 보낼 수 있는 경우 ( 유량이 증가된 경우 )
                 if pushed:
 
                     # 유량 추가
-                    self.flow[u][v] += pushed
+                    self.flow[e] += pushed
 
                     # 역방향 간선의 유량 제거
-                    self.flow[v][u] -= pushed
+                    self.flow[e ^ 1] -= pushed
 
                     # 증가된 유량 반환
                     return pushed
                 
             # 다음 간선으로 이동
-            self.last[u] += 1
+            self.last[u] = self.next[e]
         
         # 증가된 유량 없음
-        return 0
\ No newline at end of file
+        return 0
+
+    def blocking_flow(self, s: int, t: int, delta: int = 1) -> int:
+        """
+        이 메소드는 명시적 스택을 사용하여 현재 레벨 그래프의 blocking flow를 계산합니다.
+        재귀 없이 s에서부터 경로를 확장하며, t에 도달하면 경로 상의 최소 잔여 용량만큼 유량을 보낸 뒤
+        처음으로 포화된 간선의 시작 정점까지만 후퇴하여 다음 경로를 이어서 탐색합니다.
+        막다른 정점에서는 'self.last'를 다음 간선으로 옮겨 같은 간선을 다시 보지 않도록 합니다.
+        'bfs'로 'self.depth'를, 'self.head'로 'self.last'를 미리 초기화해 두어야 합니다.
+
+        Args:
+            s (int): 현재 레벨 그래프의 시작 정점
+            t (int): 현재 레벨 그래프의 도착 정점
+            delta (int, optional): 사용할 간선의 최소 잔여 용량, 기본값은 1
+
+        Returns:
+            int: 이번 단계에서 증가된 유량의 값
+        """
+
+        # 반복문에서 사용할 배열들을 지역 변수로 가져옴
+        to, cap, flow, nxt = self.to, self.cap, self.flow, self.next
+        depth, last = self.depth, self.last
+
+        # 이번 단계에서 증가된 유량
+        pushed = 0
+
+        # s에서 현재 정점까지의 경로를 이루는 간선 번호 스택
+        path = []
+
+        # 현재 정점
+        u = s
+
+        while True:
+
+            # 도착 노드에 도달한 경우
+            if u == t:
+
+                # 경로 상의 최소 잔여 용량 계산
+                f = min(cap[e] - flow[e] for e in path)
+
+                # 경로 상의 모든 간선에 유량 추가 및 역방향 간선의 유량 제거
+                for e in path:
+                    flow[e] += f
+                    flow[e ^ 1] -= f
+
+                # 증가된 유량 누적
+                pushed += f
+
+                # 잔여 용량이 delta 미만이 된 첫 간선의 위치를 찾아 그 시작 정점까지 후퇴
+                i = next(i for i, e in enumerate(path) if cap[e] - flow[e] < delta)
+                del path[i:]
+                u = to[path[-1]] if path else s
+                continue
+
+            # 현재 정점에서 레벨 그래프 상의 잔여 용량이 delta 이상인 간선을 찾을 때까지 다음 간선으로 이동
+            e = last[u]
+            while e != -1 and (depth[to[e]] != depth[u] + 1 or cap[e] - flow[e] < delta):
+                e = nxt[e]
+            last[u] = e
+
+            # 진행할 간선이 있는 경우 경로를 확장
+            if e != -1:
+                path.append(e)
+                u = to[e]
+
+            # 막다른 정점인데 시작 정점인 경우 blocking flow 완성
+            elif u == s:
+                break
+
+            # 막다른 정점인 경우 직전 정점으로 후퇴하고, 직전 정점의 간선을 다음 간선으로 이동
+            else:
+                e = path.pop()
+                u = to[e ^ 1]
+                last[u] = nxt[e]
+
+        # 증가된 유량 반환
+        return pushed
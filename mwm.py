@@ -1,99 +1,43 @@
-from heapq import heappush, heappop
-from itertools import accumulate
+from array import array
+from heapq import heappush, heappop, heapify
+from itertools import accumulate, chain
 from collections import deque
 from sys import stdin
 from math import inf
+from typing import Callable
 
-class EdgeEvent:
-    def __init__(self, time: int, frm: int, to: int):
-        """
-        간선 이벤트 객체를 초기화합니다.
-
-        Args:
-            time (int): 이벤트 발생 시간
-            frm (int): 간선의 시작 정점
-            to (int): 간선의 끝 정점
-        """
-
-        # 이벤트 발생 시간
-        self.time = time
-
-        # 간선의 시작 정점
-        self.frm = frm
+class DaryHeap:
+    """
+    ID로 원소를 찾아 갱신할 수 있는 d진 최소 힙을 구현하는 클래스입니다.
+    원소마다 객체를 만들지 않고 키와 간선 정보( frm, to ), 힙 위치를 ID로 인덱싱하는 평탄한 배열에 저장하며,
+    비교는 정수 키끼리만 수행합니다. 자식이 d개이므로 이진 힙보다 트리 높이가 낮아 갱신 시 이동 횟수가 줄어듭니다.
+    """
 
-        # 간선의 끝 정점
-        self.to = to
-    
-    def __lt__(self, rhs: 'EdgeEvent') -> bool:
+    def __init__(self, n: int, d: int = 4):
         """
-        두 간선 이벤트 객체를 비교합니다. 시간 기준으로 비교합니다.
-
         Args:
-            rhs (EdgeEvent): 비교할 다른 간선 이벤트 객체
-
-        Returns:
-            bool: 현재 객체의 시간이 더 작으면 True, 그렇지 않으면 False
-        """
-        return self.time < rhs.time
-    
-    def __gt__(self, rhs: 'EdgeEvent') -> bool:
+            n (int): 힙에 저장할 수 있는 ID의 수 ( 0 ~ n - 1 )
+            d (int, optional): 각 노드의 자식 수, 기본값은 4
         """
-        두 간선 이벤트 객체를 비교합니다. 시간 기준으로 비교합니다.
-
-        Args:
-            rhs (EdgeEvent): 비교할 다른 간선 이벤트 객체
 
-        Returns:
-            bool: 현재 객체의 시간이 더 크면 True, 그렇지 않으면 False
-        """
-        return self.time > rhs.time
-
-class BinaryHeap:
-    class Node:
-        def __init__(self, value: int | EdgeEvent, id: int = 0):
-            """
-            힙 노드를 초기화합니다.
-
-            Args:
-                value (int | EdgeEvent): 노드의 값
-                id (int, optional): 노드의 ID.
-            """
-
-            # 노드의 값
-            self.value = value
-
-            # 노드의 ID
-            self.id = id
-
-        def __lt__(self, rhs: 'BinaryHeap.Node') -> bool:
-            """
-            노드의 값을 비교합니다.
-
-            Args:
-                rhs (BinaryHeap.Node): 비교할 노드
-
-            Returns:
-                bool: 현재 노드의 값이 rhs 노드의 값보다 작은지 여부
-            """
-            return self.value < rhs.value
-
-    def __init__(self, n: int, isEdgeEvent: bool):
-        """
-        이진 힙을 초기화합니다.
-
-        Args:
-            n (int): 힙에 저장할 수 있는 최대 노드 수
-            isEdgeEvent (bool): 노드 값의 타입이 EdgeEvent인지 여부
-        """
+        # 자식 수
+        self.d = d
 
         # 현재 힙의 크기
         self.size_ = 0
 
-        # 노드 배열
-        self.node = [BinaryHeap.Node(EdgeEvent(0, 0, 0) if isEdgeEvent else 0) for _ in range(n + 1)]
+        # 힙 배열 ( 힙 위치 -> ID )
+        self.heap = array('i', [0]) * n
+
+        # 위치 배열 ( ID -> 힙 위치, 힙에 없으면 -1 )
+        self.pos = array('i', [-1]) * n
 
-        # 인덱스 배열
-        self.index = [0 for _ in range(n)]
+        # ID별 키 ( 이벤트 발생 시간 )
+        self.key = array('q', [0]) * n
+
+        # ID별 간선의 시작 정점과 끝 정점
+        self.frm = array('i', [0]) * n
+        self.to = array('i', [0]) * n
 
     def size(self) -> int:
         """
@@ -118,281 +62,247 @@ class BinaryHeap:
         힙을 초기화합니다.
         """
 
-        # 힙에 원소가 존재하지 않을 때까지 반복
-        while self.size_ > 0:
+        # 힙에 들어 있는 ID들의 위치만 초기화
+        for i in range(self.size_):
+            self.pos[self.heap[i]] = -1
+        self.size_ = 0
 
-            # 해당 인덱스를 0으로 설정
-            self.index[self.node[self.size_].id] = 0
+    def min(self) -> int:
+        """
+        힙에서 최소 키를 반환합니다.
 
-            # 힙 크기를 감소
-            self.size_ -= 1
+        Returns:
+            int: 힙의 최소 키
+        """
+        return self.key[self.heap[0]]
 
-    def min(self) -> int | EdgeEvent:
+    def argmin(self) -> int:
         """
-        힙에서 최소 값을 반환합니다.
+        힙에서 최소 키를 가진 원소의 ID를 반환합니다.
 
         Returns:
-            int | EdgeEvent: 힙의 최소 값
+            int: 최소 키를 가진 원소의 ID
         """
-        return self.node[1].value
+        return self.heap[0]
 
-    def argmin(self) -> int:
+    def edge(self, id: int) -> tuple[int, int]:
         """
-        힙에서 최소 값의 ID를 반환합니다.
+        주어진 ID의 간선 정보를 반환합니다.
+
+        Args:
+            id (int): 원소의 ID
 
         Returns:
-            int: 최소 값의 ID
+            tuple[int, int]: 간선의 시작 정점과 끝 정점
         """
-        return self.node[1].id
+        return self.frm[id], self.to[id]
 
-    def get_val(self, id: int) -> int | EdgeEvent:
+    def has(self, id: int) -> bool:
         """
-        주어진 ID의 값을 반환합니다.
+        주어진 ID의 원소가 힙에 존재하는지 확인합니다.
 
         Args:
-            id (int): 값을 가져올 노드의 ID
+            id (int): 확인할 원소의 ID
 
         Returns:
-            int | EdgeEvent: 노드의 값
+            bool: 원소가 존재하면 True, 아니면 False
         """
-        return self.node[self.index[id]].value
+        return self.pos[id] >= 0
 
     def pop(self) -> None:
         """
-        힙에서 최소 값을 제거합니다.
+        힙에서 최소 키를 가진 원소를 제거합니다.
         """
 
-        # 힙이 비어있지 않은 경우 루트 노드를 제거
+        # 힙이 비어있지 않은 경우 루트 원소를 제거
         if self.size_ > 0:
-            self._pop(1)
+            self._remove(0)
 
     def erase(self, id: int) -> None:
         """
-        주어진 ID의 노드를 힙에서 제거합니다.
+        주어진 ID의 원소를 힙에서 제거합니다.
 
         Args:
-            id (int): 제거할 노드의 ID
+            id (int): 제거할 원소의 ID
         """
 
-        # 주어진 ID의 노드가 존재한다면 해당 노드를 제거
-        if self.index[id]:
-            self._pop(self.index[id])
+        # 주어진 ID의 원소가 존재한다면 해당 원소를 제거
+        if self.pos[id] >= 0:
+            self._remove(self.pos[id])
 
-    def has(self, id: int) -> bool:
+    def push(self, id: int, key: int, frm: int = 0, to: int = 0) -> None:
         """
-        주어진 ID의 노드가 힙에 존재하는지 확인합니다.
+        힙에 새로운 원소를 추가합니다.
 
         Args:
-            id (int): 확인할 노드의 ID
-
-        Returns:
-            bool: 노드가 존재하면 True, 아니면 False
+            id (int): 추가할 원소의 ID
+            key (int): 추가할 키
+            frm (int, optional): 간선의 시작 정점
+            to (int, optional): 간선의 끝 정점
         """
-        return self.index[id] != 0
 
-    def update(self, id: int, v: int | EdgeEvent) -> None:
-        """
-        주어진 ID의 노드 값을 갱신합니다.
+        # 키와 간선 정보 저장
+        self.key[id], self.frm[id], self.to[id] = key, frm, to
 
-        Args:
-            id (int): 갱신할 노드의 ID
-            v (int | EdgeEvent): 새로운 값
-        """
-
-        # 노드가 없으면 힙에 추가
-        if not self.has(id):
-            self.push(id, v)
-            return
-        
-        # 새로운 값이 더 작은지 여부
-        up = v < self.node[self.index[id]].value
-
-        # 노드 값을 갱신
-        self.node[self.index[id]].value = v
-
-        # 새로운 값이 더 작은 경우 값을 위로 올림
-        if up:
-            self._up_heap(self.index[id])
-
-        # 새로운 값이 더 큰 경우 값을 아래로 내림
-        else:
-            self._down_heap(self.index[id])
+        # 힙의 마지막 위치에 추가한 뒤 위로 올림
+        self.heap[self.size_] = id
+        self.pos[id] = self.size_
+        self.size_ += 1
+        self._up_heap(self.size_ - 1)
 
-    def decrease_key(self, id: int, v: int | EdgeEvent) -> None:
+    def update(self, id: int, key: int, frm: int = 0, to: int = 0) -> None:
         """
-        주어진 ID의 노드 값을 감소시킵니다.
+        주어진 ID의 키를 갱신합니다. 원소가 없으면 추가합니다.
 
         Args:
-            id (int): 갱신할 노드의 ID
-            v (int | EdgeEvent): 새로운 값
+            id (int): 갱신할 원소의 ID
+            key (int): 새로운 키
+            frm (int, optional): 간선의 시작 정점
+            to (int, optional): 간선의 끝 정점
         """
 
-        # 노드가 없으면 힙에 추가
-        if not self.has(id):
-            self.push(id, v)
+        # 원소가 없으면 힙에 추가
+        if self.pos[id] < 0:
+            self.push(id, key, frm, to)
             return
-        
-        # 새로운 값이 더 작은 경우
-        if v < self.node[self.index[id]].value:
 
-            # 노드 값을 갱신
-            self.node[self.index[id]].value = v
+        # 새로운 키가 더 작은지 여부
+        up = key < self.key[id]
 
-            # 값을 위로 올림
-            self._up_heap(self.index[id])
+        # 키와 간선 정보 갱신
+        self.key[id], self.frm[id], self.to[id] = key, frm, to
 
-    def push(self, id: int, v: int | EdgeEvent) -> None:
+        # 새로운 키가 더 작은 경우 위로 올리고, 아니면 아래로 내림
+        if up:
+            self._up_heap(self.pos[id])
+        else:
+            self._down_heap(self.pos[id])
+
+    def decrease_key(self, id: int, key: int, frm: int = 0, to: int = 0) -> None:
         """
-        힙에 새로운 노드를 추가합니다.
+        주어진 ID의 키를 새로운 키가 더 작을 때만 감소시킵니다. 원소가 없으면 추가합니다.
 
         Args:
-            id (int): 추가할 노드의 ID
-            v (int | EdgeEvent): 추가할 값
+            id (int): 갱신할 원소의 ID
+            key (int): 새로운 키
+            frm (int, optional): 간선의 시작 정점
+            to (int, optional): 간선의 끝 정점
         """
 
-        # 힙 크기 증가
-        self.size_ += 1
-
-        # 인덱스 설정
-        self.index[id] = self.size_
-
-        # 노드 추가
-        self.node[self.size_] = BinaryHeap.Node(v, id)
+        # 원소가 없으면 힙에 추가
+        if self.pos[id] < 0:
+            self.push(id, key, frm, to)
 
-        # 값을 위로 올림
-        self._up_heap(self.size_)
+        # 새로운 키가 더 작은 경우 갱신한 뒤 위로 올림
+        elif key < self.key[id]:
+            self.key[id], self.frm[id], self.to[id] = key, frm, to
+            self._up_heap(self.pos[id])
 
-    def _pop(self, pos: int) -> None:
+    def _remove(self, i: int) -> None:
         """
-        힙에서 주어진 위치의 노드를 제거합니다.
+        힙에서 주어진 위치의 원소를 제거합니다.
 
         Args:
-            pos (int): 제거할 노드의 위치
+            i (int): 제거할 원소의 위치
         """
 
-        # 인덱스를 0으로 설정
-        self.index[self.node[pos].id] = 0
-
-        # 제거할 노드의 위치가 힙 크기와 동일하다면
-        if pos == self.size_:
-
-            # 힙 크기 감소
-            self.size_ -= 1
-            return
-        
-        # 마지막 노드가 더 작은지 여부 확인
-        up = self.node[self.size_].value < self.node[pos].value
-
-        # 마지막 노드를 현재 위치로 이동
-        self.node[pos] = self.node[self.size_]
-
-        # 힙 크기 감소
+        # 제거할 원소의 위치 초기화 및 힙 크기 감소
+        id = self.heap[i]
+        self.pos[id] = -1
         self.size_ -= 1
 
-        # 인덱스 갱신
-        self.index[self.node[pos].id] = pos
+        # 마지막 원소를 제거한 경우 종료
+        if i == self.size_:
+            return
 
-        # 마지막 노드가 더 작은 경우 값을 위로 올림
-        if up:
-            self._up_heap(pos)
-        
-        # 마지막 노드가 더 큰 경우 값을 아래로 내림
+        # 마지막 원소를 빈 자리로 옮긴 뒤, 키에 따라 위로 올리거나 아래로 내림
+        last = self.heap[self.size_]
+        self.heap[i] = last
+        self.pos[last] = i
+        if self.key[last] < self.key[id]:
+            self._up_heap(i)
         else:
-            self._down_heap(pos)
+            self._down_heap(i)
 
-    def _swap_node(self, a: int, b: int):
+    def _up_heap(self, i: int) -> None:
         """
-        주어진 두 위치의 노드를 교환합니다.
+        주어진 위치의 원소를 부모보다 키가 작은 동안 위로 올립니다.
 
         Args:
-            a (int): 첫 번째 노드의 위치
-            b (int): 두 번째 노드의 위치
+            i (int): 재정렬할 원소의 위치
         """
+        heap, pos, key, d = self.heap, self.pos, self.key, self.d
+        id = heap[i]
+        k = key[id]
 
-        # 노드 교환
-        self.node[a], self.node[b] = self.node[b], self.node[a]
+        # 부모를 한 칸씩 내리며 들어갈 자리를 찾음
+        while i > 0:
+            p = (i - 1) // d
+            parent = heap[p]
+            if key[parent] <= k:
+                break
+            heap[i] = parent
+            pos[parent] = i
+            i = p
 
-        # 인덱스 갱신
-        self.index[self.node[a].id] = a
-        self.index[self.node[b].id] = b
+        heap[i] = id
+        pos[id] = i
 
-    def _down_heap(self, pos: int):
+    def _down_heap(self, i: int) -> None:
         """
-        힙을 아래로 이동하여 재정렬합니다.
+        주어진 위치의 원소를 가장 작은 자식보다 키가 큰 동안 아래로 내립니다.
 
         Args:
-            pos (int): 재정렬할 노드의 위치
+            i (int): 재정렬할 원소의 위치
         """
+        heap, pos, key, d, n = self.heap, self.pos, self.key, self.d, self.size_
+        id = heap[i]
+        k = key[id]
 
-        k = nk = pos
-        while k << 1 <= self.size_:
+        while (c := i * d + 1) < n:
 
-            # 왼쪽 자식 노드와 비교하여 더 작은 값을 nk에 설정
-            if self.node[k << 1] < self.node[nk]:
-                nk = k << 1
+            # d개의 자식 중 키가 가장 작은 자식을 찾음
+            best, best_key = c, key[heap[c]]
+            for j in range(c + 1, min(c + d, n)):
+                if key[heap[j]] < best_key:
+                    best, best_key = j, key[heap[j]]
 
-            # 오른쪽 자식 노드와 비교하여 더 작은 값을 nk에 설정
-            if (k << 1) + 1 <= self.size_ and self.node[(k << 1) + 1] < self.node[nk]:
-                nk = (k << 1) + 1
-
-            # k와 nk가 같으면 반복 종료
-            if k == nk:
+            # 가장 작은 자식보다 키가 작거나 같으면 종료
+            if best_key >= k:
                 break
 
-            # 노드를 교환
-            self._swap_node(k, nk)
-
-            # k를 nk로 갱신
-            k = nk
+            # 가장 작은 자식을 한 칸 올림
+            child = heap[best]
+            heap[i] = child
+            pos[child] = i
+            i = best
 
-    def _up_heap(self, pos: int):
-        """
-        힙을 위로 이동하여 재정렬합니다.
-
-        Args:
-            pos (int): 재정렬할 노드의 위치
-        """
-        k = pos
-        while k > 1 and self.node[k] < self.node[k >> 1]:
-
-            # 부모 노드와 비교하여 더 작은 값을 가진 노드로 교환
-            self._swap_node(k, k >> 1)
-
-            # k를 부모 노드로 갱신
-            k >>= 1
+        heap[i] = id
+        pos[id] = i
 
 class PairingHeaps:
     """
     페어링 힙(Pairing Heap)을 구현하는 클래스입니다.
     이 클래스는 힙을 여러 개의 트리 구조로 관리하여 효율적인 삽입, 삭제, 감소 키 연산을 지원합니다.
+    노드마다 객체를 만들지 않고, 키( time, frm, to )와 트리 포인터( child, next, prev )를 노드 번호로 인덱싱하는 평탄한 배열에 저장합니다.
     """
 
-    class Node:
-        """
-        페어링 힙의 노드를 나타내는 클래스입니다.
-        """
-
-        def __init__(self, key: EdgeEvent = EdgeEvent(0, 0, 0)):
-        
-            # 노드의 키 값 설정
-            self.key = key
-
-            # 자식 노드 초기화
-            self.child = 0
-
-            # 형제 노드 초기화
-            self.next = 0
-
-            # 루트 노드는 prev를 -1로 설정
-            self.prev = -1 if key.time == key.frm == key.to == 0 else 0
-
     def __init__(self, h: int, n: int):
 
         # 루트 노드들을 저장할 리스트 초기화
         self.heap = [0 for _ in range(h)]
 
-        # 노드들을 저장할 리스트 초기화
-        self.node = [PairingHeaps.Node() for _ in range(n)]
+        # 노드의 키 ( 이벤트 발생 시간, 간선의 시작 정점, 간선의 끝 정점 )
+        self.key_time = [0 for _ in range(n)]
+        self.key_from = [0 for _ in range(n)]
+        self.key_to = [0 for _ in range(n)]
+
+        # 노드의 첫 번째 자식과 다음 형제
+        self.child = [0 for _ in range(n)]
+        self.next = [0 for _ in range(n)]
+
+        # 노드의 부모 또는 이전 형제 ( 루트 노드는 0, 사용되지 않는 노드는 -1 )
+        self.prev = [-1 for _ in range(n)]
 
     def clear(self, h: int) -> None:
         """
@@ -417,8 +327,10 @@ class PairingHeaps:
             self.heap[i] = 0
 
         # 모든 노드들을 초기화
-        for i in range(len(self.node)):
-            self.node[i] = self.Node()
+        n = len(self.prev)
+        self.key_time[:] = self.key_from[:] = self.key_to[:] = [0 for _ in range(n)]
+        self.child[:] = self.next[:] = [0 for _ in range(n)]
+        self.prev[:] = [-1 for _ in range(n)]
 
     def empty(self, h: int) -> bool:
         """
@@ -442,9 +354,9 @@ class PairingHeaps:
         Returns:
             bool: 노드가 사용 중이면 True, 그렇지 않으면 False
         """
-        return self.node[v].prev >= 0
+        return self.prev[v] >= 0
 
-    def min(self, h: int) -> EdgeEvent:
+    def min(self, h: int) -> tuple[int, int, int]:
         """
         특정 힙의 최소 값을 반환합니다.
         
@@ -452,9 +364,10 @@ class PairingHeaps:
             h (int): 힙의 인덱스
         
         Returns:
-            EdgeEvent: 힙의 최소 값
+            tuple[int, int, int]: 힙의 최소 키 ( 이벤트 발생 시간, 간선의 시작 정점, 간선의 끝 정점 )
         """
-        return self.node[self.heap[h]].key
+        v = self.heap[h]
+        return self.key_time[v], self.key_from[v], self.key_to[v]
 
     def argmin(self, h: int) -> int:
         """
@@ -477,16 +390,19 @@ class PairingHeaps:
         """
         self.erase(h, self.heap[h])
 
-    def push(self, h: int, v: int, key: EdgeEvent) -> None:
+    def push(self, h: int, v: int, time: int, frm: int, to: int) -> None:
         """
         새로운 노드를 힙에 추가합니다.
         
         Args:
             h (int): 힙의 인덱스
             v (int): 추가할 노드의 인덱스
-            key (EdgeEvent): 노드의 키 값
+            time (int): 이벤트 발생 시간 ( 노드의 키 값 )
+            frm (int): 간선의 시작 정점
+            to (int): 간선의 끝 정점
         """
-        self.node[v] = self.Node(key)
+        self.key_time[v], self.key_from[v], self.key_to[v] = time, frm, to
+        self.child[v] = self.next[v] = self.prev[v] = 0
         self.heap[h] = self._merge(self.heap[h], v)
 
     def erase(self, h: int, v: int):
@@ -503,10 +419,10 @@ class PairingHeaps:
             return
 
         # 노드의 자식을 병합
-        merged_child = self._two_pass_pairing(self.node[v].child)
+        merged_child = self._two_pass_pairing(self.child[v])
         
         # 노드가 루트 노드인 경우
-        if not self.node[v].prev:
+        if not self.prev[v]:
 
             # 힙의 루트를 병합된 자식으로 설정
             self.heap[h] = merged_child
@@ -521,27 +437,29 @@ class PairingHeaps:
             self.heap[h] = self._merge(self.heap[h], merged_child)
 
         # 노드를 초기화하여 사용되지 않음을 표시
-        self.node[v].prev = -1
+        self.prev[v] = -1
 
-    def decrease_key(self, h: int, v: int, key: EdgeEvent):
+    def decrease_key(self, h: int, v: int, time: int, frm: int, to: int):
         """
         특정 노드의 키 값을 감소시킵니다.
         
         Args:
             h (int): 힙의 인덱스
             v (int): 키 값을 감소시킬 노드의 인덱스
-            key (EdgeEvent): 새로운 키 값
+            time (int): 새로운 이벤트 발생 시간 ( 노드의 키 값 )
+            frm (int): 간선의 시작 정점
+            to (int): 간선의 끝 정점
         """
 
         # 노드가 사용 중인지 확인
         if not self.used(v):
 
             # 사용 중이 아니면 push를 통해 노드를 추가
-            return self.push(h, v, key)
+            return self.push(h, v, time, frm, to)
         
         # 노드가 루트 노드인 경우 키 값을 직접 설정
-        if not self.node[v].prev:
-            self.node[v].key = key
+        if not self.prev[v]:
+            self.key_time[v], self.key_from[v], self.key_to[v] = time, frm, to
 
         # 노드가 루트 노드가 아닌 경우        
         else:
@@ -550,7 +468,7 @@ class PairingHeaps:
             self._cut(v)
 
             # 새로운 키 값을 설정
-            self.node[v].key = key
+            self.key_time[v], self.key_from[v], self.key_to[v] = time, frm, to
             
             # 노드를 힙에 병합
             self.heap[h] = self._merge(self.heap[h], v)
@@ -567,14 +485,14 @@ class PairingHeaps:
         while v:
 
             # 자식 노드가 존재하면 재귀적으로 초기화
-            if self.node[v].child:
-                self._clear_rec(self.node[v].child)
+            if self.child[v]:
+                self._clear_rec(self.child[v])
 
             # 현재 노드의 prev 값을 -1로 설정하여 초기화
-            self.node[v].prev = -1
+            self.prev[v] = -1
 
             # 다음 형제 노드로 이동
-            v = self.node[v].next
+            v = self.next[v]
 
     def _cut(self, v: int):
         """
@@ -584,21 +502,21 @@ class PairingHeaps:
             v (int): 분리할 노드의 인덱스
         """
         # 부모 노드와 형제 노드의 인덱스를 가져옴
-        parent, next_node = self.node[v].prev, self.node[v].next
+        parent, next_node = self.prev[v], self.next[v]
 
         # 부모 노드의 자식 노드가 v인 경우 부모 노드의 자식을 next_node로 설정
-        if self.node[parent].child == v:
-            self.node[parent].child = next_node
+        if self.child[parent] == v:
+            self.child[parent] = next_node
 
         # 부모 노드의 다음 형제가 v인 경우 부모 노드의 다음 형제를 next_node로 설정
         else:
-            self.node[parent].next = next_node
+            self.next[parent] = next_node
 
         # 형제 노드의 prev 값을 부모 노드로 설정
-        self.node[next_node].prev = parent
+        self.prev[next_node] = parent
 
         # 현재 노드 v의 prev와 next 값을 0으로 초기화
-        self.node[v].next = self.node[v].prev = 0
+        self.next[v] = self.prev[v] = 0
 
     def _merge(self, left: int, right: int) -> int:
         """
@@ -621,15 +539,15 @@ class PairingHeaps:
             return left
 
         # 두 노드의 키를 비교하여 작은 키를 가진 노드가 루트가 되도록 설정
-        if self.node[left].key > self.node[right].key:
+        if self.key_time[left] > self.key_time[right]:
             left, right = right, left
 
         # 오른쪽 노드를 왼쪽 노드의 자식으로 설정
-        self.node[right].next = self.node[left].child
-        self.node[left].child = self.node[self.node[right].next].prev = right
+        self.next[right] = self.child[left]
+        self.child[left] = self.prev[self.next[right]] = right
 
         # 오른쪽 노드의 부모를 왼쪽 노드로 설정
-        self.node[right].prev = left
+        self.prev[right] = left
 
         # 병합된 트리의 루트 노드 인덱스를 반환
         return left
@@ -655,44 +573,44 @@ class PairingHeaps:
         while a:
 
             # a의 다음 노드를 가져옴
-            next_root = self.node[a].next
+            next_root = self.next[a]
             next_a = 0
 
             # a의 이전 노드와 다음 노드를 초기화
-            self.node[a].prev = self.node[a].next = 0
+            self.prev[a] = self.next[a] = 0
 
             # next_root가 존재한다면
             if next_root:
 
                 # b의 다음 노드를 가져옴
-                next_a = self.node[next_root].next
+                next_a = self.next[next_root]
 
                 # b의 이전 노드와 다음 노드를 초기화
-                self.node[next_root].prev = self.node[next_root].next = 0
+                self.prev[next_root] = self.next[next_root] = 0
 
             # a와 b를 병합
             a = self._merge(a, next_root)
 
             # 병합된 노드를 first_pass_root에 연결
-            self.node[a].next = first_pass_root
+            self.next[a] = first_pass_root
 
             # 다음 순회를 위해 변수 업데이트
             a, first_pass_root = next_a, a
 
         # 두 번째 순회: 병합된 트리들을 다시 병합
         second_pass_root = first_pass_root
-        s = self.node[first_pass_root].next
+        s = self.next[first_pass_root]
 
         # first_pass_root의 다음 노드를 초기화
-        self.node[first_pass_root].next = 0
+        self.next[first_pass_root] = 0
 
         while s:
 
             # s의 다음 노드를 가져옴
-            t = self.node[s].next
+            t = self.next[s]
 
             # s의 다음 노드를 초기화
-            self.node[s].next = 0
+            self.next[s] = 0
 
             # first_pass_root와 s를 병합
             second_pass_root = self._merge(second_pass_root, s)
@@ -703,283 +621,240 @@ class PairingHeaps:
         # 병합된 트리의 루트 노드를 반환
         return second_pass_root
 
-class PriorityQueue:
+class TightEdgeQueue:
     """
-    우선순위 큐를 구현하는 클래스입니다.
-    이 클래스는 최소 힙(min heap)을 기반으로 하여 우선순위가 높은(작은) 항목을 빠르게 추출할 수 있습니다.
-    """
-    def __init__(self):
+    외부 정점 사이의 간선이 tight해지는 시간을 관리하는 lazy-deletion 우선순위 큐입니다.
 
-        # 우선순위 큐 데이터를 저장할 리스트 초기화
-        self._data = []
+    각 항목 ( 시간, 정점, 간선 번호 )은 하나의 정수 ( time << 64 | x << 32 | edge_id )로 묶어 저장하므로
+    힙 연산은 객체의 __lt__ 호출 없이 정수 비교만으로 이루어집니다.
+    블로섬 축약으로 양 끝이 같은 블로섬에 들어간 간선은 바로 지우지 않고, 최솟값을 볼 때 버리거나( stale pop )
+    힙의 크기가 마지막 정리 직후 크기의 'factor'배를 넘을 때 한꺼번에 걸러냅니다( compaction ).
+    """
 
-    def min(self) -> EdgeEvent:
+    def __init__(self, is_stale: Callable[[int, int], bool], factor: int = 2, min_size: int = 1024):
         """
-        우선순위가 가장 높은(작은) 항목을 반환합니다.
-        
-        Returns:
-            EdgeEvent: 우선순위가 가장 높은 항목
+        Args:
+            is_stale (Callable[[int, int], bool]): 정점 x와 간선 번호 edge_id를 받아 항목이 더 이상 쓸모없는지 판단하는 함수
+            factor (int, optional): 정리 직후 크기의 몇 배를 넘으면 다시 정리할지, 기본값은 2
+            min_size (int, optional): 이 크기 이하에서는 정리하지 않음, 기본값은 1024
         """
 
-        # _data의 첫 번째 항목이 우선순위가 가장 높은 항목
-        return self._data[0]
+        # 정수로 묶은 항목들의 최소 힙
+        self._data = []
+
+        # 항목이 쓸모없는지 판단하는 함수
+        self.is_stale = is_stale
+
+        # 정리 기준
+        self.factor = factor
+        self.min_size = min_size
+        self._limit = min_size
+
+        # 통계: 추가된 항목 수, 꺼낸 항목 수, 그중 쓸모없어서 버린 항목 수, 정리 횟수, 정리로 버린 항목 수
+        self.pushes = self.pops = self.stale_pops = 0
+        self.compactions = self.compacted = 0
 
     def clear(self) -> None:
         """
-        우선순위 큐를 초기화하여 비웁니다.
+        큐를 비웁니다. 통계는 유지됩니다.
         """
-
-        # _data 리스트를 초기화하여 모든 항목 제거
         self._data.clear()
+        self._limit = self.min_size
 
-    def push(self, item: EdgeEvent) -> None:
+    def push(self, time: int, x: int, edge_id: int) -> None:
         """
-        새로운 항목을 우선순위 큐에 추가합니다.
-        
+        간선 이벤트를 추가합니다.
+
         Args:
-            item (EdgeEvent): 우선순위 큐에 추가할 항목
+            time (int): 간선이 tight해지는 시간
+            x (int): 간선의 시작 정점
+            edge_id (int): 간선 번호
         """
+        heappush(self._data, time << 64 | x << 32 | edge_id)
+        self.pushes += 1
 
-        # heappush를 사용하여 항목을 최소 힙 구조로 추가
-        heappush(self._data, item)
+        # 힙이 너무 커지면 쓸모없는 항목을 정리
+        if len(self._data) > self._limit:
+            self._compact()
 
-    def pop(self) -> EdgeEvent:
+    def min_time(self) -> int:
         """
-        우선순위가 가장 높은(작은) 항목을 제거하고 반환합니다.
-        
+        쓸모없는 항목을 앞에서부터 버린 뒤, 남은 항목 중 가장 이른 시간을 반환합니다.
+
         Returns:
-            EdgeEvent: 우선순위가 가장 높은 항목
+            int: 가장 이른 시간, 큐가 비어 있으면 inf
         """
+        data = self._data
+        while data:
+            item = data[0]
+            if not self.is_stale(item >> 32 & 0xFFFFFFFF, item & 0xFFFFFFFF):
+                return item >> 64
+            heappop(data)
+            self.pops += 1
+            self.stale_pops += 1
+        return inf
 
-        # _data 리스트가 비어있지 않은 경우 heappop을 사용하여 항목 제거 및 반환
-        return heappop(self._data) if self._data else None
-
-    def empty(self) -> bool:
+    def pop(self) -> tuple[int, int, int]:
         """
-        우선순위 큐가 비어 있는지 확인합니다.
-        
+        가장 이른 항목을 꺼냅니다. 'min_time'을 먼저 호출하여 맨 앞의 항목이 유효한지 확인해야 합니다.
+
         Returns:
-            bool: 큐가 비어 있으면 True, 그렇지 않으면 False
+            tuple[int, int, int]: ( 시간, 간선의 시작 정점, 간선 번호 )
         """
+        item = heappop(self._data)
+        self.pops += 1
+        return item >> 64, item >> 32 & 0xFFFFFFFF, item & 0xFFFFFFFF
 
-        # _data 리스트의 길이가 0인지 확인
-        return len(self._data) == 0
-
-class InputEdge:
-    """
-    입력 그래프의 간선을 나타내는 클래스입니다.
-    """
-
-    def __init__(self, frm: int, to: int, cost: int):
-
-        # 간선의 시작 정점
-        self.frm = frm
-
-        # 간선의 도착 정점
-        self.to = to
-
-        # 간선의 비용
-        self.cost = cost
-    
-    def __lt__(self, rhs: 'InputEdge') -> bool:
+    def stale_ratio(self) -> float:
         """
-        두 간선을 비교하여 순서를 결정합니다.
-        
-        Args:
-            rhs (InputEdge): 비교 대상이 되는 다른 간선
-            
+        지금까지 꺼내거나 정리로 버린 항목 중 쓸모없던 항목의 비율을 반환합니다.
+
         Returns:
-            bool: 현재 간선이 비교 대상 간선보다 작은지 여부
+            float: 쓸모없던 항목의 비율 ( 아무것도 꺼내지 않았다면 0.0 )
         """
+        removed = self.pops + self.compacted
+        return (self.stale_pops + self.compacted) / removed if removed else 0.0
 
-        # 시작 정점이 동일한 경우
-        if self.frm == rhs.frm:
-
-            # 도착 정점이 동일한 경우 비용을 비교
-            if self.to == rhs.to:
-                return self.cost < rhs.cost
-            
-            # 도착 정점을 비교
-            return self.to < rhs.to
-        
-        # 시작 정점을 비교
-        return self.frm < rhs.frm
-
+    def _compact(self) -> None:
+        """
+        쓸모없는 항목을 모두 걸러내고 힙을 다시 구성합니다.
+        """
+        live = [item for item in self._data if not self.is_stale(item >> 32 & 0xFFFFFFFF, item & 0xFFFFFFFF)]
+        self.compacted += len(self._data) - len(live)
+        self.compactions += 1
+        heapify(live)
+        self._data = live
+        self._limit = max(self.min_size, self.factor * len(live))
 
 class MaximumWeightedMatching:
     K_SEPARATED, K_INNER, K_FREE, K_OUTER = -2, -1, 0, 1
 
-    class Node:
-        class NodeLink:
-            def __init__(self, blossom_id: int, vertex_id: int):
-                """
-                노드 링크를 초기화합니다.
-
-                Args:
-                    blossom_id (int): 링크된 블로섬의 ID
-                    vertex_id (int): 링크된 정점의 ID
-                """
-
-                # 링크된 블로섬의 ID
-                self.b = blossom_id
-
-                # 링크된 정점의 ID
-                self.v = vertex_id
-
-        def __init__(self, u: int):
-            """
-            노드를 초기화합니다.
-
-            Args:
-                u (int): 노드의 ID
-            """
-
-            # 부모 노드의 ID
-            self.parent = 0
-
-            # 노드 크기
-            self.size = 1
-
-            # 링크 배열
-            self.link = [self.NodeLink(u, u), self.NodeLink(u, u)]
-
-        def next_v(self) -> int:
-            """
-            다음 정점의 ID를 반환합니다.
-
-            Returns:
-                int: 다음 정점의 ID
-            """
-
-            # 첫 번째 링크의 정점 ID 반환
-            return self.link[0].v
-
-        def next_b(self) -> int:
-            """
-            다음 블로섬의 ID를 반환합니다.
-
-            Returns:
-                int: 다음 블로섬의 ID
-            """
-
-            # 첫 번째 링크의 블로섬 ID 반환
-            return self.link[0].b
-
-        def prev_v(self) -> int:
-            """
-            이전 정점의 ID를 반환합니다.
-
-            Returns:
-                int: 이전 정점의 ID
-            """
+    def __init__(self, n: int, bipartite: bool = True):
+        """
+        Args:
+            n (int): 노드의 개수.
+            bipartite (bool, optional): True이면 그래프가 이분 그래프일 때 블로섬 처리 없이 이분 매칭 엔진으로 풉니다.
+        """
+        
+        # 노드의 개수
+        self.N = n
 
-            # 두 번째 링크의 정점 ID 반환
-            return self.link[1].v
+        # 이분 그래프 전용 엔진 사용 여부
+        self.bipartite = bipartite
 
-        def prev_b(self) -> int:
-            """
-            이전 블로섬의 ID를 반환합니다.
+        # 가능한 블로섬의 수
+        self.B = self.N - 1 >> 1
 
-            Returns:
-                int: 이전 블로섬의 ID
-            """
+        # 노드와 블로섬, 더미 노드를 포함한 총 슬롯 수
+        self.S = self.N + self.B + 1
 
-            # 두 번째 링크의 블로섬 ID 반환
-            return self.link[1].b
-    
-    class Link:
-        def __init__(self, frm: int, to: int):
-            """
-            두 정점을 연결하는 링크를 초기화합니다.
+        # 입력받은 간선의 양 끝 정점과 가중치
+        self.input_us = array('i')
+        self.input_vs = array('i')
+        self.input_ws = array('q')
 
-            Args:
-                frm (int): 링크의 시작 정점 ID
-                to (int): 링크의 끝 정점 ID
-            """
+        # 힙이 할당된 슬롯 수 ( 아직 할당되지 않았으면 -1, 이 이하의 그래프는 'reset' 후 힙을 재사용 )
+        self.capacity = -1
 
-            # 링크의 시작 정점 ID
-            self.frm = frm
+        # 마지막 'approximate_matching'의 보장 비율과, 그 결과로부터 얻은 최적값의 상한
+        self.ratio, self.upper_bound = 1.0, None
 
-            # 링크의 끝 정점 ID
-            self.to = to
-    
-    class Edge:
-        def __init__(self, to: int, cost: int):
-            """
-            그래프의 간선을 초기화합니다.
+    @classmethod
+    def from_arrays(cls, n: int, us, vs, ws, bipartite: bool = True) -> 'MaximumWeightedMatching':
+        """
+        간선들의 양 끝 정점과 가중치 배열로부터 매칭 인스턴스를 한 번에 구성합니다.
 
-            Args:
-                to (int): 간선이 연결된 정점의 ID
-                cost (int): 간선의 비용
-            """
+        Args:
+            n (int): 노드의 개수
+            us: 간선의 첫 번째 노드 배열 ( list, array, NumPy 배열 등 )
+            vs: 간선의 두 번째 노드 배열
+            ws: 간선의 가중치 배열
+            bipartite (bool, optional): 이분 그래프 전용 엔진 사용 여부
 
-            # 간선이 연결된 정점의 ID
-            self.to = to
+        Returns:
+            MaximumWeightedMatching: 간선이 모두 추가된 매칭 인스턴스
+        """
+        g = cls(n, bipartite)
+        g.add_edges(us, vs, ws)
+        return g
 
-            # 간선의 비용
-            self.cost = cost
+    def reset(self, n: int | None = None) -> None:
+        """
+        입력 간선을 모두 지우고 다음 그래프를 풀 준비를 합니다.
+        이미 할당된 힙은 새 그래프의 슬롯 수가 할당된 크기 이하라면 다음 'initialize'에서 비우기만 하고 다시 사용하므로,
+        비슷한 크기의 그래프를 연속으로 풀 때 힙 노드를 매번 새로 만들지 않습니다.
 
-    class Event:
-        def __init__(self, time: int, id: int):
-            """
-            이벤트 객체를 초기화합니다.
+        Args:
+            n (int | None, optional): 새 그래프의 노드의 개수, None이면 기존 개수를 유지
+        """
 
-            Args:
-                time (int): 이벤트 발생 시간
-                id (int): 이벤트 ID
-            """
+        # 노드 수가 바뀌면 블로섬 수와 슬롯 수를 다시 계산
+        if n is not None:
+            self.N = n
+            self.B = self.N - 1 >> 1
+            self.S = self.N + self.B + 1
 
-            # 이벤트 발생 시간
-            self.time = time
+        # 입력 간선 배열은 객체를 유지한 채 비움
+        del self.input_us[:], self.input_vs[:], self.input_ws[:]
 
-            # 이벤트 ID
-            self.id = id
-            
-        def __lt__(self, rhs: 'MaximumWeightedMatching.Event') -> bool:
-            """
-            두 이벤트 객체를 비교합니다. 시간 기준으로 비교합니다.
+    def add_edges(self, us, vs, ws) -> None:
+        """
+        여러 간선을 한 번에 추가합니다. 'add_edge'를 간선 수만큼 호출한 것과 같습니다.
+        array나 NumPy 배열은 원소마다 파이썬 객체를 만들지 않고 입력 간선 배열에 바로 이어 붙입니다.
 
-            Args:
-                rhs (Event): 비교할 다른 이벤트 객체
+        Args:
+            us: 간선의 첫 번째 노드 배열 ( list, array, NumPy 배열 등 )
+            vs: 간선의 두 번째 노드 배열
+            ws: 간선의 가중치 배열
+        """
+        self.input_us.extend(self._as_array('i', us))
+        self.input_vs.extend(self._as_array('i', vs))
+        self.input_ws.extend(self._as_array('q', ws))
 
-            Returns:
-                bool: 현재 객체의 시간이 더 작으면 True, 그렇지 않으면 False
-            """
+    def read_edges(self, source=None, m: int | None = None) -> None:
+        """
+        공백으로 구분된 "u v w" 정수 세 개씩을 읽어 간선으로 추가합니다.
+        한 번에 전체를 읽고 토큰을 잘라 'add_edges'로 넘기므로, 줄마다 input()으로 읽는 것보다 훨씬 빠릅니다.
 
-            return self.time < rhs.time
-        
-        def __gt__(self, rhs: 'MaximumWeightedMatching.Event') -> bool:
-            """
-            두 이벤트 객체를 비교합니다. 시간 기준으로 비교합니다.
+        Args:
+            source (optional): 'read' 메서드가 있는 파일 객체 또는 bytes / str 버퍼, 기본값은 표준 입력의 바이너리 버퍼
+            m (int | None, optional): 읽을 간선의 수, None이면 남은 입력을 모두 읽음
+        """
 
-            Args:
-                rhs (Event): 비교할 다른 이벤트 객체
+        # 읽을 대상이 없으면 표준 입력을 사용
+        if source is None:
+            source = stdin.buffer
 
-            Returns:
-                bool: 현재 객체의 시간이 더 크면 True, 그렇지 않으면 False
-            """
+        # 파일 객체라면 전체를 읽어 토큰으로 분리
+        tokens = (source.read() if hasattr(source, 'read') else source).split()
+        if m is not None:
+            tokens = tokens[:3 * m]
 
-            return self.time > rhs.time
+        # 세 개씩 끊어 간선의 양 끝 정점과 가중치로 추가
+        values = array('q', map(int, tokens))
+        self.add_edges(values[0::3], values[1::3], values[2::3])
 
-    def __init__(self, n: int):
+    @staticmethod
+    def _as_array(typecode: str, values) -> array:
         """
+        주어진 값들을 지정한 타입의 array로 변환합니다.
+        이미 같은 타입의 array라면 그대로 반환하고, NumPy 배열처럼 'tolist'를 지원하는 객체는 한 번에 변환합니다.
+
         Args:
-            n (int): 노드의 개수.
-        """
-        
-        # 노드의 개수
-        self.N = n
+            typecode (str): 변환할 array의 타입 코드
+            values: 변환할 값들
 
-        # 가능한 블로섬의 수
-        self.B = self.N - 1 >> 1
+        Returns:
+            array: 변환된 배열
+        """
 
-        # 노드와 블로섬, 더미 노드를 포함한 총 슬롯 수
-        self.S = self.N + self.B + 1
+        # 같은 타입의 array는 복사하지 않음
+        if isinstance(values, array) and values.typecode == typecode:
+            return values
 
-        # 입력받은 간선을 저장할 리스트
-        self.input_edge: list[InputEdge] = []
+        # tolist를 지원하면 파이썬 리스트로 바꾼 뒤 변환
+        return array(typecode, values.tolist() if hasattr(values, 'tolist') else values)
 
-    
     def maximum_weighted_matching(self) -> tuple[int, list[int]]:
         """
         최대 가중치를 가지는 매칭을 찾습니다.
@@ -993,6 +868,11 @@ class MaximumWeightedMatching:
 
         # 상태 초기화
         self.initialize()
+
+        # 이분 그래프라면 블로섬이 생기지 않으므로 이분 매칭 엔진으로 처리
+        if self.color is not None:
+            self.bipartite_matching()
+            return (self.calculate_total_weight(), self.mate)
         
         # 각 노드의 잠재력 설정
         self.set_potential()
@@ -1005,6 +885,224 @@ class MaximumWeightedMatching:
         # 최적의 값을 계산하고 매칭된 노드 리스트와 함께 반환
         return (self.calculate_total_weight(), self.mate)
 
+    def approximate_matching(self, mode: str = "greedy", eps: float = 0.1) -> tuple[int, list[int]]:
+        """
+        최대 가중치 매칭의 근사해를 찾습니다. 반환 형식은 'maximum_weighted_matching'과 같습니다.
+
+        - "greedy": 가중치가 큰 간선부터 양 끝 정점이 모두 비어 있으면 고릅니다. O(E log E), 1/2 근사
+        - "path_growing": Drake-Hougardy 알고리즘으로 가장 무거운 간선을 따라 경로를 키우며 간선을 두 매칭에 번갈아 넣고,
+          더 무거운 쪽을 고릅니다. O(V + E), 1/2 근사
+        - "scaling": greedy 결과 G로 OPT ≥ G를 얻은 뒤, 가중치를 δ = εG / ⌊V/2⌋ 단위로 내림하여 정확한 알고리즘으로 풉니다.
+          매칭 간선은 ⌊V/2⌋개 이하이므로 손실은 εG ≤ ε·OPT 이하이며, 가중치의 종류가 줄어 정확한 알고리즘의 이벤트가 크게 줄어듭니다. (1 - ε) 근사
+
+        호출 후 self.ratio에는 보장된 근사 비율이, self.upper_bound에는 최적값의 상한이 저장됩니다.
+
+        Args:
+            mode (str, optional): "greedy", "path_growing", "scaling" 중 하나, 기본값은 "greedy"
+            eps (float, optional): "scaling"에서 허용할 상대 오차, 기본값은 0.1
+
+        Returns:
+            tuple[int, list[int]]: 매칭의 총 가중치와 매칭된 노드들의 리스트를 반환합니다.
+        """
+        return {
+            "greedy": self.greedy_matching,
+            "path_growing": self.path_growing_matching,
+            "scaling": lambda: self.scaling_matching(eps),
+        }[mode]()
+
+    def greedy_matching(self) -> tuple[int, list[int]]:
+        """
+        가중치가 큰 간선부터 양 끝 정점이 모두 비어 있는 간선을 고르는 1/2 근사 매칭을 찾습니다.
+
+        Returns:
+            tuple[int, list[int]]: 매칭의 총 가중치와 매칭된 노드들의 리스트를 반환합니다.
+        """
+        us, vs, ws = self.input_us, self.input_vs, self.input_ws
+        mate = [0 for _ in range(self.S)]
+        total = 0
+
+        # 가중치의 내림차순으로 간선을 보며, 양수 가중치 간선만 고름
+        for i in sorted(range(len(ws)), key=ws.__getitem__, reverse=True):
+            if ws[i] <= 0:
+                break
+            u, v = us[i], vs[i]
+            if u != v and not mate[u] and not mate[v]:
+                mate[u], mate[v] = v, u
+                total += ws[i]
+
+        self.ratio, self.upper_bound = 0.5, total << 1
+        return total, mate
+
+    def path_growing_matching(self) -> tuple[int, list[int]]:
+        """
+        Drake-Hougardy의 경로 확장 알고리즘으로 1/2 근사 매칭을 선형 시간에 찾습니다.
+
+        아직 지워지지 않은 정점에서 시작하여, 현재 정점에 붙은 가장 무거운 간선을 따라 이동하면서 그 간선을 두 매칭에 번갈아 넣고
+        지나온 정점을 지웁니다. 각 간선은 한쪽 끝이 지워질 때 두 매칭 중 하나의 간선에 의해 지배되므로 더 무거운 매칭이 1/2 근사입니다.
+
+        Returns:
+            tuple[int, list[int]]: 매칭의 총 가중치와 매칭된 노드들의 리스트를 반환합니다.
+        """
+        self.build_graph()
+        offset, edge_to, edge_cost = self.offset, self.edge_to, self.edge_cost
+
+        # 두 매칭에 들어간 간선들과 그 가중치의 합
+        matchings, weights = ([], []), [0, 0]
+        removed = [False for _ in range(self.N + 1)]
+
+        for x in range(1, self.N + 1):
+            i = 0
+            while not removed[x]:
+                removed[x] = True
+
+                # 지워지지 않은 이웃 중 가장 무거운 양수 가중치 간선 탐색
+                best, y = 0, 0
+                for edge_id in range(offset[x], offset[x + 1]):
+                    if edge_cost[edge_id] > best and not removed[edge_to[edge_id]]:
+                        best, y = edge_cost[edge_id], edge_to[edge_id]
+                if not y:
+                    break
+
+                # 간선을 현재 매칭에 넣고 다음 정점으로 이동 ( 비용은 두 배로 저장되어 있음 )
+                matchings[i].append((x, y))
+                weights[i] += best >> 1
+                i ^= 1
+                x = y
+
+        # 더 무거운 매칭 선택
+        k = weights[1] > weights[0]
+        mate = [0 for _ in range(self.S)]
+        for u, v in matchings[k]:
+            mate[u], mate[v] = v, u
+
+        self.ratio, self.upper_bound = 0.5, weights[k] << 1
+        return weights[k], mate
+
+    def scaling_matching(self, eps: float) -> tuple[int, list[int]]:
+        """
+        가중치를 내림하여 정확한 알고리즘으로 푸는 (1 - eps) 근사 매칭을 찾습니다.
+
+        Args:
+            eps (float): 허용할 상대 오차
+
+        Returns:
+            tuple[int, list[int]]: 매칭의 총 가중치와 매칭된 노드들의 리스트를 반환합니다.
+        """
+
+        # greedy 결과로 최적값의 하한을 얻음
+        greedy, greedy_mate = self.greedy_matching()
+        if greedy == 0:
+            self.ratio = 1 - eps
+            return greedy, greedy_mate
+
+        # 매칭 간선 수의 상한 k와 허용 손실 t로 가중치를 w * k // t로 내림 ( 한 간선의 손실은 t / k 미만 )
+        k, t = self.N >> 1, max(1, int(eps * greedy))
+        scaled = MaximumWeightedMatching(self.N, self.bipartite)
+        scaled.add_edges(self.input_us, self.input_vs, array('q', (w * k // t for w in self.input_ws)))
+        _, mate = scaled.maximum_weighted_matching()
+
+        # 원래 가중치로 매칭의 총 가중치 계산 ( 같은 정점 쌍의 간선이 여러 개라면 가장 무거운 간선 )
+        best = {}
+        for u, v, w in zip(self.input_us, self.input_vs, self.input_ws):
+            if u != v and mate[u] == v:
+                key = min(u, v), max(u, v)
+                best[key] = max(best.get(key, w), w)
+        total = sum(best.values())
+
+        self.ratio, self.upper_bound = 1 - eps, total + t
+        return total, mate
+
+    def bipartite_matching(self) -> None:
+        """
+        이분 그래프에서 최대 가중치 매칭을 구하여 self.mate에 저장합니다.
+
+        색이 0인 정점을 행, 색이 1인 정점을 열로 보고, 각 행마다 "매칭하지 않음"을 뜻하는 비용 0의 더미 열을 붙이면
+        최대 가중치 매칭은 간선 비용이 -w인 최소 비용 할당 문제가 됩니다.
+        행을 하나씩 추가하면서 포텐셜로 축약한 비용 위에서 Dijkstra로 비어 있는 열까지의 최단 증가 경로를 찾고,
+        비어 있는 열을 처음 꺼내는 순간 탐색을 멈추므로 탐색은 보통 새 행 주변의 작은 영역에서 끝납니다.
+        """
+
+        N, offset, edge_to, edge_cost, color = self.N, self.offset, self.edge_to, self.edge_cost, self.color
+
+        # 열 번호: 색이 1인 정점 v는 v, 행 u의 더미 열은 N + u
+        col_mate = [0 for _ in range(N << 1 | 1)]
+        row_mate = [0 for _ in range(N + 1)]
+
+        # 행과 열의 포텐셜 ( 모든 간선에서 c(u, x) - pu[u] - pv[x] >= 0, 매칭된 간선에서는 0 )
+        pu = [0 for _ in range(N + 1)]
+        pv = [0 for _ in range(N << 1 | 1)]
+
+        # Dijkstra에서 사용할 열까지의 거리, 직전 행, 확정 여부
+        dist = [inf for _ in range(N << 1 | 1)]
+        pred = [0 for _ in range(N << 1 | 1)]
+        done = [False for _ in range(N << 1 | 1)]
+
+        for i in range(1, N + 1):
+
+            # 색이 1인 정점이거나 간선이 없는 정점은 건너뜀
+            if color[i] or offset[i] == offset[i + 1]:
+                continue
+
+            # 새 행의 포텐셜을 가장 작은 축약 비용에 맞춤 ( 더미 열의 비용 0 포함 )
+            pu[i] = min(0, min(-edge_cost[e] - pv[edge_to[e]] for e in range(offset[i], offset[i + 1])))
+
+            # 새 행에서 바로 갈 수 있는 열들의 거리로 힙 초기화
+            heap, touched = [], []
+            for x, c in chain(((edge_to[e], -edge_cost[e]) for e in range(offset[i], offset[i + 1])), ((N + i, 0),)):
+                if (d := c - pu[i] - pv[x]) < dist[x]:
+                    if dist[x] == inf:
+                        touched.append(x)
+                    dist[x], pred[x] = d, i
+                    heappush(heap, (d, x))
+
+            # 비어 있는 열을 꺼낼 때까지 Dijkstra 진행
+            finished = []
+            while True:
+                d, x = heappop(heap)
+                if done[x] or d > dist[x]:
+                    continue
+                done[x] = True
+                finished.append(x)
+
+                # 비어 있는 열에 도달하면 최단 증가 경로 완성
+                if not (r := col_mate[x]):
+                    break
+
+                # 열 x에 매칭된 행 r에서 나가는 간선 완화 ( 매칭 간선의 축약 비용은 0 )
+                base = d - pu[r]
+                for y, c in chain(((edge_to[e], -edge_cost[e]) for e in range(offset[r], offset[r + 1])), ((N + r, 0),)):
+                    if not done[y] and (nd := base + c - pv[y]) < dist[y]:
+                        if dist[y] == inf:
+                            touched.append(y)
+                        dist[y], pred[y] = nd, r
+                        heappush(heap, (nd, y))
+
+            # 확정된 열과 그 열에 매칭된 행의 포텐셜을 갱신하여 축약 비용이 음수가 되지 않도록 유지
+            pu[i] += d
+            for y in finished:
+                if y != x:
+                    pu[col_mate[y]] += d - dist[y]
+                    pv[y] -= d - dist[y]
+
+            # 증가 경로를 따라 거슬러 올라가며 매칭을 뒤집음
+            while True:
+                r = pred[x]
+                prev = row_mate[r]
+                col_mate[x], row_mate[r] = r, x
+                if r == i:
+                    break
+                x = prev
+
+            # 이번 탐색에서 사용한 상태 초기화
+            for y in touched:
+                dist[y], done[y] = inf, False
+
+        # 실제 열( 더미 열이 아닌 열 )에 매칭된 행만 매칭으로 기록
+        self.mate = [0 for _ in range(self.S)]
+        for u in range(1, N + 1):
+            if 0 < (x := row_mate[u]) <= N:
+                self.mate[u], self.mate[x] = x, u
+
     def calculate_total_weight(self) -> int:
         """
         최적 매칭의 총 가중치를 계산합니다.
@@ -1024,8 +1122,8 @@ class MaximumWeightedMatching:
 
                 # u에 연결된 모든 간선 중 매칭된 간선의 비용을 찾음
                 for edge_id in range(self.offset[u], self.offset[u + 1]):
-                    if self.edges[edge_id].to == self.mate[u]:
-                        max_cost = max(max_cost, self.edges[edge_id].cost)
+                    if self.edge_to[edge_id] == self.mate[u]:
+                        max_cost = max(max_cost, self.edge_cost[edge_id])
 
                 # 최대 비용을 더함
                 ret += max_cost
@@ -1073,18 +1171,18 @@ class MaximumWeightedMatching:
             return
         
         # 노드 v의 링크가 자기 자신으로 연결된 경우
-        if self.link[v].to == self.surface[self.link[v].to]:
+        if self.link_to[v] == self.surface[self.link_to[v]]:
 
             # 노드 t를 노드 v의 from과 매칭
-            self.mate[t] = self.link[v].frm
+            self.mate[t] = self.link_from[v]
 
             # 노드 t와 다시 재매칭
             self.rematch(self.mate[t], t)
 
         # 아닌 경우 노드 v의 from과 to를 각각 재매칭
         else:
-            self.rematch(self.link[v].frm, self.link[v].to)
-            self.rematch(self.link[v].to, self.link[v].frm)
+            self.rematch(self.link_from[v], self.link_to[v])
+            self.rematch(self.link_to[v], self.link_from[v])
     
     def fix_mate_and_base(self, blossom_id: int) -> None:
         """
@@ -1105,16 +1203,16 @@ class MaximumWeightedMatching:
         base_vertex = self.base[blossom_id]
 
         # 매칭 상태를 수정할 노드와 블로섬을 초기화
-        matched_vertex, matched_blossom = self.node[base_vertex].link[0].v, self.node[base_vertex].link[0].b
-        direction = self.node[matched_blossom].link[1].v != self.mate[matched_vertex]
+        matched_vertex, matched_blossom = self.next_v[base_vertex], self.next_b[base_vertex]
+        direction = self.prev_v[matched_blossom] != self.mate[matched_vertex]
 
         while True:
 
             # 블로섬 내의 다음 노드와 블로섬을 찾음
-            matched_vertex, matched_blossom = self.node[base_vertex].link[direction].v, self.node[base_vertex].link[direction].b
+            matched_vertex, matched_blossom = self.node_v[direction][base_vertex], self.node_b[direction][base_vertex]
 
             # 매칭 상태가 다른 경우 루프를 종료
-            if self.node[matched_blossom].link[1 ^ direction].v != self.mate[matched_vertex]:
+            if self.node_v[1 ^ direction][matched_blossom] != self.mate[matched_vertex]:
                 break
 
             # 블로섬 bv와 bmv의 매칭과 기본 노드를 수정
@@ -1122,7 +1220,7 @@ class MaximumWeightedMatching:
             self.fix_mate_and_base(matched_blossom)
 
             # base_vertex를 다음 블로섬으로 갱신
-            base_vertex = self.node[matched_blossom].link[direction].b
+            base_vertex = self.node_b[direction][matched_blossom]
 
         # 블로섬의 기본 노드를 갱신
         self.base[blossom_id] = base_vertex
@@ -1144,8 +1242,8 @@ class MaximumWeightedMatching:
         # 현재 시간 초기화
         self.current_time = 0
 
-        # 이벤트값 초기화
-        self.event = self.Event(inf, 0)
+        # 이벤트값 초기화 ( 가장 이른 정점 이벤트의 시간과 정점 )
+        self.event_time, self.event_id = inf, 0
 
     def reset_blossom(self, blossom_id: int) -> None:
         """
@@ -1163,8 +1261,8 @@ class MaximumWeightedMatching:
         self.label[blossom_id] = self.K_FREE
 
         # 블로섬의 링크를 초기화
-        self.link[blossom_id].frm = 0
-        self.link[blossom_id].to = 0
+        self.link_from[blossom_id] = 0
+        self.link_to[blossom_id] = 0
 
         # 슬랙 값을 무한대로 설정
         self.slack[blossom_id] = inf
@@ -1182,7 +1280,7 @@ class MaximumWeightedMatching:
 
         # 0번 노드를 자유 상태로 설정
         self.label[0] = self.K_FREE
-        self.link[0].frm = 0
+        self.link_from[0] = 0
 
         # 1번 노드부터 N번 노드까지 순회
         for v in range(1, self.N + 1):
@@ -1229,7 +1327,7 @@ class MaximumWeightedMatching:
         self.queue.clear()
         self.reset_time()
         self.BinaryHeap_EdgeEvent.clear()
-        self.PriorityQueue.clear()
+        self.TightEdgeQueue.clear()
         self.BinaryHeap_int.clear()
     
     def do_edmonds_search(self, root: int) -> None:
@@ -1248,7 +1346,7 @@ class MaximumWeightedMatching:
             return
 
         # 루트 노드를 시작으로 블로섬 링크를 설정하고 외부 노드로 표시
-        self.link_blossom(self.surface[root], self.Link(0, 0))
+        self.link_blossom(self.surface[root], 0, 0)
 
         # 루트 노드를 외부 노드로 설정하고 잠재력 조정
         self.push_outer_and_fix_potentials(self.surface[root], 0)
@@ -1331,7 +1429,7 @@ class MaximumWeightedMatching:
 
             # 레이블이 INNER가 아닌 경우 heap_edge_event에 값을 추가
             if lab != self.K_INNER:
-                self.BinaryHeap_EdgeEvent.decrease_key(y, EdgeEvent(t + self.lazy[y], x, y))
+                self.BinaryHeap_EdgeEvent.decrease_key(y, t + self.lazy[y], x, y)
         else:
 
             # 도착 블로섬의 그룹 값을 가져옴
@@ -1342,15 +1440,15 @@ class MaximumWeightedMatching:
                 if t >= self.slack[gy]:
                     return
                 self.slack[gy] = t
-            self.PairingHeaps.decrease_key(by, gy, EdgeEvent(t, x, y))
+            self.PairingHeaps.decrease_key(by, gy, t, x, y)
 
             # 레이블이 INNER인 경우 함수 종료
             if lab == self.K_INNER:
                 return
             
             # heap_blossom_edge_event에서 최솟값을 가져와 heap_edge_event에 값을 추가
-            m = self.PairingHeaps.min(by)
-            self.BinaryHeap_EdgeEvent.decrease_key(by, EdgeEvent(m.time + self.lazy[by], m.frm, m.to))
+            time, frm, to = self.PairingHeaps.min(by)
+            self.BinaryHeap_EdgeEvent.decrease_key(by, time + self.lazy[by], frm, to)
     
     def activate_heap_edge_event_node(self, blossom_id: int) -> None:
         """
@@ -1365,13 +1463,13 @@ class MaximumWeightedMatching:
 
             # 슬랙 값이 무한대가 아니면 heap_edge_event에 추가
             if self.slack[blossom_id] < inf:
-                self.BinaryHeap_EdgeEvent.push(blossom_id, EdgeEvent(self.slack[blossom_id] + self.lazy[blossom_id], self.best_from[blossom_id], blossom_id))
+                self.BinaryHeap_EdgeEvent.push(blossom_id, self.slack[blossom_id] + self.lazy[blossom_id], self.best_from[blossom_id], blossom_id)
         else:
 
             # heap_blossom_edge_event가 비어있지 않으면 최솟값을 heap_edge_event에 추가
             if not self.PairingHeaps.empty(blossom_id):
-                m = self.PairingHeaps.min(blossom_id)
-                self.BinaryHeap_EdgeEvent.push(blossom_id, EdgeEvent(m.time + self.lazy[blossom_id], m.frm, m.to))
+                time, frm, to = self.PairingHeaps.min(blossom_id)
+                self.BinaryHeap_EdgeEvent.push(blossom_id, time + self.lazy[blossom_id], frm, to)
     
     def swap_blossom(self, b1: int, b2: int) -> None:
         """
@@ -1393,7 +1491,8 @@ class MaximumWeightedMatching:
             self.heavy[b1] = b2
         
         # 연결 정보를 교환
-        self.link[b1], self.link[b2] = self.link[b2], self.link[b1]
+        self.link_from[b1], self.link_from[b2] = self.link_from[b2], self.link_from[b1]
+        self.link_to[b1], self.link_to[b2] = self.link_to[b2], self.link_to[b1]
         
         # 짝을 이루는 노드를 교환
         self.mate[b1], self.mate[b2] = self.mate[b2], self.mate[b1]
@@ -1409,10 +1508,12 @@ class MaximumWeightedMatching:
         
         # 두 노드의 연결 정보를 업데이트
         for d in range(2):
-            self.node[self.node[b1].link[d].b].link[d ^ 1].b = b2
+            self.node_b[d ^ 1][self.node_b[d][b1]] = b2
         
-        # 두 노드 객체 자체를 교환
-        self.node[b1], self.node[b2] = self.node[b2], self.node[b1]
+        # 두 노드의 크기와 블로섬 순환 링크를 교환
+        self.size[b1], self.size[b2] = self.size[b2], self.size[b1]
+        for arr in (self.next_b, self.next_v, self.prev_b, self.prev_v):
+            arr[b1], arr[b2] = arr[b2], arr[b1]
     
     def set_surface_and_group(self, blossom_id: int, surface: int, group: int) -> None:
         """
@@ -1437,7 +1538,7 @@ class MaximumWeightedMatching:
                 self.set_surface_and_group(based_b, surface, group)
 
                 # 다음 노드로 이동
-                based_b = self.node[based_b].next_b()
+                based_b = self.next_b[based_b]
     
     def merge_smaller_blossoms(self, blossom_id: int) -> None:
         """
@@ -1457,12 +1558,12 @@ class MaximumWeightedMatching:
         while True:
 
             # 현재 노드의 크기가 가장 큰 블로섬보다 크면 업데이트
-            if self.node[b].size > largest_size:
-                largest_size = self.node[b].size
+            if self.size[b] > largest_size:
+                largest_size = self.size[b]
                 largest_blossom_id = b
                 
             # 순회 종료 조건
-            if (b := self.node[b].next_b()) == beta:
+            if (b := self.next_b[b]) == beta:
                 break
 
         # 작은 블로섬들을 순회하면서 가장 큰 블로섬으로 병합
@@ -1470,7 +1571,7 @@ class MaximumWeightedMatching:
         while True:
             if b != largest_blossom_id:
                 self.set_surface_and_group(b, largest_blossom_id, b)
-            if (b := self.node[b].next_b()) == beta:
+            if (b := self.next_b[b]) == beta:
                 break
 
         # 그룹 설정
@@ -1501,17 +1602,17 @@ class MaximumWeightedMatching:
         h = -(edge_id + 1)
 
         # mate로 연결된 노드 업데이트
-        self.link[self.surface[self.mate[bx]]].frm = h
-        self.link[self.surface[self.mate[by]]].frm = h
+        self.link_from[self.surface[self.mate[bx]]] = h
+        self.link_from[self.surface[self.mate[by]]] = h
 
         # 최소 공통 조상(LCA)을 찾는 루프
         while True:
             if self.mate[by]:
                 bx, by = by, bx
-            bx = lca = self.surface[self.link[bx].frm]
-            if self.link[self.surface[self.mate[bx]]].frm == h:
+            bx = lca = self.surface[self.link_from[bx]]
+            if self.link_from[self.surface[self.mate[bx]]] == h:
                 break
-            self.link[self.surface[self.mate[bx]]].frm = h
+            self.link_from[self.surface[self.mate[bx]]] = h
         
         # 새로운 블로섬의 인덱스를 가져옴
         self.unused_blossom_id_index -= 1
@@ -1520,19 +1621,22 @@ class MaximumWeightedMatching:
         # 블로섬 트리의 크기를 초기화
         tree_size = 0
 
+        # 블로섬 순환 링크 배열 ( 0: 다음, 1: 이전 )
+        node_b, node_v = self.node_b, self.node_v
+
         # 두 블로섬을 하나의 블로섬으로 합치는 과정
         for d in range(2):
             blossom_vertex = self.surface[x]
             while blossom_vertex != lca:
                 mate_vertex = self.mate[blossom_vertex]
                 blossom_mate_vertex, v = self.surface[mate_vertex], self.mate[mate_vertex]
-                frm, to = self.link[v].frm, self.link[v].to
+                frm, to = self.link_from[v], self.link_to[v]
 
                 # 블로섬의 크기 업데이트
-                tree_size += self.node[blossom_vertex].size + self.node[blossom_mate_vertex].size
+                tree_size += self.size[blossom_vertex] + self.size[blossom_mate_vertex]
 
                 # 새로운 링크 설정
-                self.link[mate_vertex] = self.Link(x, y)
+                self.link_from[mate_vertex], self.link_to[mate_vertex] = x, y
                 
                 # 잠재력 업데이트
                 if blossom_vertex > self.N:
@@ -1544,18 +1648,18 @@ class MaximumWeightedMatching:
                 self.push_outer_and_fix_potentials(blossom_mate_vertex, self.fix_blossom_potential(self.K_INNER, blossom_mate_vertex))
 
                 # 블로섬 간 링크 설정 (bv를 bmv로 연결)
-                self.node[blossom_vertex].link[d] = self.Node.NodeLink(blossom_mate_vertex, mate_vertex)
-                self.node[blossom_mate_vertex].link[d ^ 1] = self.Node.NodeLink(blossom_vertex, v)
+                node_b[d][blossom_vertex], node_v[d][blossom_vertex] = blossom_mate_vertex, mate_vertex
+                node_b[d ^ 1][blossom_mate_vertex], node_v[d ^ 1][blossom_mate_vertex] = blossom_vertex, v
 
                 # 다음 블로섬의 표면 업데이트
                 blossom_vertex = self.surface[frm]
 
                 # 다음 링크 설정
-                self.node[blossom_mate_vertex].link[d] = self.Node.NodeLink(blossom_vertex, frm)
-                self.node[blossom_vertex].link[d ^ 1] = self.Node.NodeLink(blossom_mate_vertex, to)
+                node_b[d][blossom_mate_vertex], node_v[d][blossom_mate_vertex] = blossom_vertex, frm
+                node_b[d ^ 1][blossom_vertex], node_v[d ^ 1][blossom_vertex] = blossom_mate_vertex, to
 
             # 외부 블로섬 링크 설정
-            self.node[self.surface[x]].link[d ^ 1] = self.Node.NodeLink(self.surface[y], y)
+            node_b[d ^ 1][self.surface[x]], node_v[d ^ 1][self.surface[x]] = self.surface[y], y
 
             # x와 y를 교체하여 다음 반복에서 처리
             x, y = y, x
@@ -1565,9 +1669,9 @@ class MaximumWeightedMatching:
             self.potential[lca] += (self.current_time - self.time_created[lca]) << 1
         
         # 새로운 블로섬의 크기, base, link, matching 설정
-        self.node[blossom_id].size = tree_size + self.node[lca].size
+        self.size[blossom_id] = tree_size + self.size[lca]
         self.base[blossom_id] = lca
-        self.link[blossom_id] = self.link[lca]
+        self.link_from[blossom_id], self.link_to[blossom_id] = self.link_from[lca], self.link_to[lca]
         self.mate[blossom_id] = self.mate[lca]
         self.label[blossom_id] = self.K_OUTER
         self.surface[blossom_id] = blossom_id
@@ -1578,17 +1682,18 @@ class MaximumWeightedMatching:
         # 작은 블로섬들을 병합
         self.merge_smaller_blossoms(blossom_id)
 
-    def link_blossom(self, v: int, link: Link) -> None:
+    def link_blossom(self, v: int, frm: int, to: int) -> None:
         """
         주어진 노드를 블로섬에 연결합니다.
         
         Args:
             v (int): 노드의 인덱스
-            link (Link): 연결할 링크 정보 (frm, to)
+            frm (int): 연결할 링크의 시작 정점
+            to (int): 연결할 링크의 끝 정점
         """
 
         # 노드 v에 대한 링크를 설정
-        self.link[v] = self.Link(link.frm, link.to)
+        self.link_from[v], self.link_to[v] = frm, to
         
         # v가 단일 노드라면 종료
         if v <= self.N:
@@ -1598,13 +1703,13 @@ class MaximumWeightedMatching:
         base_vertex = self.base[v]
 
         # 블로섬의 베이스 노드(b)와 링크 정보를 설정
-        self.link_blossom(base_vertex, link)
+        self.link_blossom(base_vertex, frm, to)
         
         # 이전 블로섬 노드(pb)를 가져옴
-        prev_base_vertex = self.node[base_vertex].prev_b()
+        prev_base_vertex = self.prev_b[base_vertex]
 
         # 현재 블로섬의 이전 노드(v)를 기준으로 링크 정보 설정
-        link = self.Link(self.node[prev_base_vertex].next_v(), self.node[base_vertex].prev_v())
+        frm, to = self.next_v[prev_base_vertex], self.prev_v[base_vertex]
 
         # 블로섬의 베이스 노드(bv)를 가져옴
         bv = base_vertex
@@ -1613,23 +1718,23 @@ class MaximumWeightedMatching:
         while True:
 
             # 다음 블로섬 노드(bw)를 가져옴
-            bw = self.node[bv].next_b()
+            bw = self.next_b[bv]
 
             # bw가 현재 블로섬의 베이스 노드(b)와 같다면 종료
             if bw == base_vertex:
                 break
 
             # 블로섬 bw에 링크 설정
-            self.link_blossom(bw, link)
+            self.link_blossom(bw, frm, to)
 
             # 다음 블로섬 노드(nb)를 기준으로 링크 정보 설정
-            nl = self.Link(self.node[bw].prev_v(), self.node[bv].next_v())
+            next_frm, next_to = self.prev_v[bw], self.next_v[bv]
             
             # bv를 다음 블로섬 노드로 업데이트
-            bv = self.node[bw].next_b()
+            bv = self.next_b[bw]
             
             # 블로섬 bv에 링크 설정
-            self.link_blossom(bv, nl)
+            self.link_blossom(bv, next_frm, next_to)
 
     def push_outer_and_fix_potentials(self, v: int, d: int) -> None:
         """
@@ -1648,15 +1753,15 @@ class MaximumWeightedMatching:
             base_vertex = self.base[v]
             while self.label[base_vertex] != self.K_OUTER:
                 self.push_outer_and_fix_potentials(base_vertex, d)
-                base_vertex = self.node[base_vertex].next_b()
+                base_vertex = self.next_b[base_vertex]
 
         # 노드 v가 블로섬이 아니면 잠재력 값을 갱신
         else:
             self.potential[v] += self.current_time + d
-            if self.potential[v] < self.event.time:
+            if self.potential[v] < self.event_time:
 
                 # event를 갱신
-                self.event = self.Event(self.potential[v], v)
+                self.event_time, self.event_id = self.potential[v], v
 
             # 큐에 노드 v를 추가
             self.queue.append(v)
@@ -1682,7 +1787,7 @@ class MaximumWeightedMatching:
 
         # y 노드가 방문되지 않았으면 링크 초기화
         if not visited:
-            self.link_blossom(by, self.Link(0, 0))
+            self.link_blossom(by, 0, 0)
 
         # y 노드를 내부 노드로 설정
         self.label[by] = self.K_INNER
@@ -1715,16 +1820,16 @@ class MaximumWeightedMatching:
 
         # z 노드가 방문되지 않았으면 링크 초기화
         if not visited:
-            self.link_blossom(bz, self.Link(x, y))
+            self.link_blossom(bz, x, y)
 
         # z 노드가 이미 방문되었으면
         else:
 
             # 링크 업데이트
-            self.link[bz] = self.Link(x, y)
+            self.link_from[bz], self.link_to[bz] = x, y
 
             # z 노드와 매칭된 노드도 링크 업데이트
-            self.link[z] = self.Link(x, y)
+            self.link_from[z], self.link_to[z] = x, y
 
         # z 노드를 외부 노드로 설정 및 잠재력 갱신
         self.push_outer_and_fix_potentials(bz, self.fix_blossom_potential(self.K_FREE, bz))
@@ -1796,7 +1901,7 @@ class MaximumWeightedMatching:
                 v = w
 
             # 다음 블로섬이 초기 블로섬과 같아지면 반복 종료
-            if (base_blossom := self.node[base_blossom].next_b()) == start_blossom:
+            if (base_blossom := self.next_b[base_blossom]) == start_blossom:
                 break
 
         # 최소 슬랙 값을 갖는 노드 ID 반환
@@ -1847,10 +1952,10 @@ class MaximumWeightedMatching:
 
                 # to가 0보다 큰 경우, heap_blossom_edge_event에 push
                 if to > 0:
-                    self.PairingHeaps.push(surface_id, base_blossom, EdgeEvent(self.slack[base_blossom], self.best_from[base_blossom], to))
+                    self.PairingHeaps.push(surface_id, base_blossom, self.slack[base_blossom], self.best_from[base_blossom], to)
 
             # 다음 블로섬으로 이동
-            base_blossom = self.node[base_blossom].next_b()
+            base_blossom = self.next_b[base_blossom]
     
     def move_to_largest_blossom(self, blossom_id: int) -> None:
         """
@@ -1888,7 +1993,7 @@ class MaximumWeightedMatching:
                 self.PairingHeaps.erase(blossom_id, base_blossom)
 
             # base_blossom이 다시 처음으로 돌아오면 루프 종료
-            if (base_blossom := self.node[base_blossom].next_b()) == beta:
+            if (base_blossom := self.next_b[base_blossom]) == beta:
                 break
 
         # 무거운 정점이 존재하는 경우
@@ -1916,13 +2021,17 @@ class MaximumWeightedMatching:
         self.move_to_largest_blossom(blossom_id)
 
         # 이전 연결 정보를 저장
-        old_link = self.link[matched_vertex]
+        old_from, old_to = self.link_from[matched_vertex], self.link_to[matched_vertex]
         old_base = self.surface[self.mate[matched_vertex]]
-        root = self.surface[old_link.to]
-        direction = self.mate[root] == self.node[root].link[0].v
+        root = self.surface[old_to]
+        direction = self.mate[root] == self.next_v[root]
+
+        # 방향에 따른 블로섬 순환 링크 배열
+        forward_b, forward_v = self.node_b[direction], self.node_v[direction]
+        backward_b, backward_v = self.node_b[direction ^ 1], self.node_v[direction ^ 1]
 
         # 블로섬의 기본 노드에서 루트까지 경로를 따라가며 노드를 업데이트
-        current_base = self.node[old_base].link[direction ^ 1].b
+        current_base = backward_b[old_base]
         while current_base != root:
 
             # 노드의 레이블을 K_SEPARATED로 설정
@@ -1932,7 +2041,7 @@ class MaximumWeightedMatching:
             self.activate_heap_edge_event_node(current_base)
 
             # 노드 이동
-            current_base = self.node[current_base].link[direction ^ 1].b
+            current_base = backward_b[current_base]
 
             # 다음 노드도 K_SEPARATED로 설정
             self.label[current_base] = self.K_SEPARATED
@@ -1941,7 +2050,7 @@ class MaximumWeightedMatching:
             self.activate_heap_edge_event_node(current_base)
 
             # 노드 이동
-            current_base = self.node[current_base].link[direction ^ 1].b
+            current_base = backward_b[current_base]
 
         # 이전 베이스 노드부터 루트까지 경로를 따라가며 노드를 업데이트
         current_base = old_base
@@ -1951,18 +2060,19 @@ class MaximumWeightedMatching:
             self.label[current_base] = self.K_INNER
 
             # 현재 노드의 다음 노드를 가져옴
-            next_base = self.node[current_base].link[direction].b
+            next_base = forward_b[current_base]
 
             # 현재 노드가 루트인 경우 이전 연결 정보 복원
             if current_base == root:
-                self.link[self.mate[current_base]] = old_link
+                self.link_from[self.mate[current_base]], self.link_to[self.mate[current_base]] = old_from, old_to
 
             # 그렇지 않은 경우 다음 노드와의 연결 정보 업데이트
             else:
-                self.link[self.mate[current_base]] = self.Link(self.node[current_base].link[direction].v, self.node[next_base].link[direction ^ 1].v)
+                self.link_from[self.mate[current_base]], self.link_to[self.mate[current_base]] = forward_v[current_base], backward_v[next_base]
 
             # mate 연결 정보 업데이트
-            self.link[self.surface[self.mate[current_base]]] = self.link[self.mate[current_base]]
+            mate_vertex = self.mate[current_base]
+            self.link_from[self.surface[mate_vertex]], self.link_to[self.surface[mate_vertex]] = self.link_from[mate_vertex], self.link_to[mate_vertex]
 
             # 현재 노드가 원래 노드보다 큰 경우 (블로섬인 경우)
             if current_base > self.N:
@@ -1986,7 +2096,7 @@ class MaximumWeightedMatching:
             self.push_outer_and_fix_potentials(next_base, self.fix_blossom_potential(self.K_INNER, next_base))
 
             # 방향을 변경하여 다음 노드로 이동
-            current_base = self.node[next_base].link[direction].b
+            current_base = forward_b[next_base]
 
     def augment(self, root: int) -> bool:
         """
@@ -2020,8 +2130,7 @@ class MaximumWeightedMatching:
 
             # 현재 노드의 모든 엣지를 탐색
             for edge_id in range(self.offset[x], self.offset[x + 1]):
-                edge = self.edges[edge_id]
-                y = edge.to
+                y = self.edge_to[edge_id]
                 by = self.surface[y]
 
                 # 두 표면 노드가 동일한 경우 건너뜀
@@ -2035,7 +2144,7 @@ class MaximumWeightedMatching:
                 if label == self.K_OUTER:
 
                     # 감소 비용을 계산하여 시간 업데이트
-                    time = self.reduced_cost(x, y, edge.cost) >> 1
+                    time = self.reduced_cost(x, y, self.edge_cost[edge_id]) >> 1
 
                     # 업데이트된 시간이 현재 시간과 같다면 블로섬을 축소
                     if time == self.current_time:
@@ -2043,14 +2152,14 @@ class MaximumWeightedMatching:
                         bx = self.surface[x]
                     
                     # 업데이트된 시간이 event의 시간보다 작다면 우선순위 큐에 이벤트 추가
-                    elif time < self.event.time:
-                        self.PriorityQueue.push(EdgeEvent(time, x, edge_id))
+                    elif time < self.event_time:
+                        self.TightEdgeQueue.push(time, x, edge_id)
 
                 # 표면 노드가 inner 또는 free 노드인 경우
                 else:
 
                     # 감소 비용을 계산하여 시간 업데이트
-                    time = self.reduced_cost(x, y, edge.cost)
+                    time = self.reduced_cost(x, y, self.edge_cost[edge_id])
 
                     # 시간이 INF라면 스킵
                     if time >= inf:
@@ -2091,21 +2200,13 @@ class MaximumWeightedMatching:
         # 네 가지 이벤트의 최소 시간을 찾기 위해 초기화
 
         # event의 시간
-        time1 = self.event.time
+        time1 = self.event_time
 
         # heap_edge_event의 최소 시간
-        time2 = inf if self.BinaryHeap_EdgeEvent.empty() else self.BinaryHeap_EdgeEvent.min().time
-
-        # heap_tight_edge의 최소 시간
-        time3 = inf
-        while not self.PriorityQueue.empty():
-            e = self.PriorityQueue.min()
-            x, y = e.frm, self.edges[e.to].to
-            if self.surface[x] != self.surface[y]:
-                time3 = e.time
-                break
-            else:
-                self.PriorityQueue.pop()
+        time2 = inf if self.BinaryHeap_EdgeEvent.empty() else self.BinaryHeap_EdgeEvent.min()
+
+        # heap_tight_edge의 최소 시간 ( 양 끝이 같은 블로섬에 들어간 간선은 버림 )
+        time3 = self.TightEdgeQueue.min_time()
 
         # heap_node_potential의 최소 시간
         time4 = inf if self.BinaryHeap_int.empty() else self.BinaryHeap_int.min()
@@ -2114,26 +2215,22 @@ class MaximumWeightedMatching:
         self.current_time = min(time1, time2, time3, time4)
 
         # time1 이벤트가 발생한 경우
-        if self.current_time == self.event.time:
-            x = self.event.id
+        if self.current_time == self.event_time:
+            x = self.event_id
             if x != root:
                 self.rematch(x, 0) # 매칭 갱신
             return True
 
         # edge_event_heap에서 최소 시간 이벤트를 처리
-        while not self.BinaryHeap_EdgeEvent.empty() and self.BinaryHeap_EdgeEvent.min().time == self.current_time:
-            x, y = self.BinaryHeap_EdgeEvent.min().frm, self.BinaryHeap_EdgeEvent.min().to
+        while not self.BinaryHeap_EdgeEvent.empty() and self.BinaryHeap_EdgeEvent.min() == self.current_time:
+            x, y = self.BinaryHeap_EdgeEvent.edge(self.BinaryHeap_EdgeEvent.argmin())
             if self.grow(root, x, y):
                 return True
 
         # heap_tight_edge에서 최소 시간 이벤트를 처리
-        while not self.PriorityQueue.empty() and self.PriorityQueue.min().time == self.current_time:
-            edge_id = self.PriorityQueue.min().to
-            x, y = self.PriorityQueue.min().frm, self.edges[edge_id].to
-            self.PriorityQueue.pop()
-            if self.surface[x] == self.surface[y]:
-                continue
-            self.contract(x, y, edge_id)
+        while self.TightEdgeQueue.min_time() == self.current_time:
+            _, x, edge_id = self.TightEdgeQueue.pop()
+            self.contract(x, self.edge_to[edge_id], edge_id)
 
         # heap_node_potential에서 최소 시간 이벤트를 처리
         while not self.BinaryHeap_int.empty() and self.BinaryHeap_int.min() == self.current_time:
@@ -2148,38 +2245,24 @@ class MaximumWeightedMatching:
         Matching Algorithm의 초기 설정을 수행하는 메서드입니다.
         """
 
-        # 인접 리스트 구성을 관리하기 위한 오프셋 배열
-        self.offset = [0 for _ in range(self.N + 2)]
-
-        # 무향 그래프이므로 입력 간선의 두 배 크기로 배열 초기화
-        self.edges: list[MaximumWeightedMatching.Edge] = [None for _ in range(len(self.input_edge) << 1)]
+        # 입력 간선으로 CSR 형식의 인접 리스트 구성
+        self.build_graph()
 
-        # 우선순위 큐 초기화
-        self.BinaryHeap_EdgeEvent = BinaryHeap(self.S, isEdgeEvent=True)
-        self.PairingHeaps = PairingHeaps(self.S, self.S)
-        self.PriorityQueue = PriorityQueue()
-        self.BinaryHeap_int = BinaryHeap(self.S, isEdgeEvent=False)
-
-        # 각 노드의 간선 수를 오프셋 배열에 채우기
-        for edge in self.input_edge:
-            self.offset[edge.frm + 1] += 1
-            self.offset[edge.to + 1] += 1
-
-        # 누적 오프셋을 계산하여 각 노드의 간선 시작 인덱스 얻어오기
-        self.offset = list(accumulate(self.offset))
-
-        # 입력 간선 리스트에서 간선 배열 채우기
-        for edge in self.input_edge:
-            self.edges[self.offset[edge.frm]] = self.Edge(edge.to, edge.cost << 1)
-            self.offset[edge.frm] += 1
+        # 우선순위 큐 초기화 ( 'reset' 이후 슬롯 수가 할당된 크기 이하라면 기존 힙을 비워서 재사용 )
+        if self.capacity >= self.S:
+            self.BinaryHeap_EdgeEvent.clear()
+            self.PairingHeaps.clear_all()
+            self.TightEdgeQueue.clear()
+            self.BinaryHeap_int.clear()
+        else:
+            self.capacity = self.S
+            self.BinaryHeap_EdgeEvent = DaryHeap(self.S)
+            self.PairingHeaps = PairingHeaps(self.S, self.S)
+            self.TightEdgeQueue = TightEdgeQueue(self.is_stale_edge)
+            self.BinaryHeap_int = DaryHeap(self.S)
 
-            self.edges[self.offset[edge.to]] = self.Edge(edge.frm, edge.cost << 1)
-            self.offset[edge.to] += 1
-
-        # offset 배열 복원
-        for i in range(self.N + 1, 0, -1):
-            self.offset[i] = self.offset[i - 1]
-        self.offset[0] = 0
+        # 이분 그래프인지 확인하고, 이분 그래프라면 각 정점의 색을 저장 ( 아니면 None )
+        self.color = self.two_coloring() if self.bipartite else None
 
         # 큐 초기화
         self.queue = deque([])
@@ -2187,8 +2270,9 @@ class MaximumWeightedMatching:
         # 매칭 배열 초기화
         self.mate = [0 for _ in range(self.S)]
 
-        # 각 노드의 링크 초기화
-        self.link = [self.Link(0, 0) for _ in range(self.S)]
+        # 각 노드의 링크 ( 탐색 트리에서 노드를 외부 노드와 잇는 간선의 두 끝점 ) 초기화
+        self.link_from = array('i', [0]) * self.S
+        self.link_to = array('i', [0]) * self.S
 
         # 각 노드의 상태 초기화
         self.label = [self.K_FREE for _ in range(self.S)]
@@ -2202,8 +2286,15 @@ class MaximumWeightedMatching:
         # 각 노드의 잠재력
         self.potential = [0 for _ in range(self.S)]
 
-        # 각 노드를 Node 객체로 초기화
-        self.node = list(map(self.Node, range(self.S)))
+        # 각 노드가 속한 블로섬 순환에서 다음 / 이전 블로섬과, 그 블로섬으로 이어지는 간선의 정점 ( 처음에는 자기 자신 )
+        self.next_b, self.next_v = array('i', range(self.S)), array('i', range(self.S))
+        self.prev_b, self.prev_v = array('i', range(self.S)), array('i', range(self.S))
+
+        # 방향 d( 0: 다음, 1: 이전 )로 인덱싱하기 위한 묶음
+        self.node_b, self.node_v = (self.next_b, self.prev_b), (self.next_v, self.prev_v)
+
+        # 각 노드( 블로섬 )에 포함된 정점의 수
+        self.size = array('i', [1]) * self.S
 
         # 사용되지 않은 블로섬 ID
         self.unused_blossom_id = [self.N + self.B - i for i in range(self.B)]
@@ -2230,6 +2321,82 @@ class MaximumWeightedMatching:
         # 각 노드의 그룹 초기화
         self.group = list(range(self.S))
         
+    def build_graph(self) -> None:
+        """
+        입력 간선 배열로부터 CSR 형식의 인접 리스트( offset, edge_to, edge_cost )를 구성합니다.
+        간선의 비용은 두 배로 저장됩니다.
+        """
+
+        # 인접 리스트 구성을 관리하기 위한 오프셋 배열
+        self.offset = [0 for _ in range(self.N + 2)]
+
+        # 무향 그래프이므로 입력 간선의 두 배 크기로 간선의 도착 정점과 비용 배열 초기화
+        self.edge_to = array('i', [0]) * (len(self.input_ws) << 1)
+        self.edge_cost = array('q', [0]) * (len(self.input_ws) << 1)
+
+        # 각 노드의 간선 수를 오프셋 배열에 채우기
+        for u in self.input_us:
+            self.offset[u + 1] += 1
+        for v in self.input_vs:
+            self.offset[v + 1] += 1
+
+        # 누적 오프셋을 계산하여 각 노드의 간선 시작 인덱스 얻어오기
+        self.offset = list(accumulate(self.offset))
+
+        # 입력 간선 배열에서 간선 배열 채우기
+        for u, v, w in zip(self.input_us, self.input_vs, self.input_ws):
+            self.edge_to[self.offset[u]] = v
+            self.edge_cost[self.offset[u]] = w << 1
+            self.offset[u] += 1
+
+            self.edge_to[self.offset[v]] = u
+            self.edge_cost[self.offset[v]] = w << 1
+            self.offset[v] += 1
+
+        # offset 배열 복원
+        for i in range(self.N + 1, 0, -1):
+            self.offset[i] = self.offset[i - 1]
+        self.offset[0] = 0
+
+    def is_stale_edge(self, x: int, edge_id: int) -> bool:
+        """
+        tight 간선 큐의 항목이 더 이상 쓸모없는지, 즉 간선의 양 끝이 같은 블로섬에 들어갔는지 확인합니다.
+
+        Args:
+            x (int): 간선의 시작 정점
+            edge_id (int): 간선 번호
+
+        Returns:
+            bool: 간선의 양 끝이 같은 블로섬에 속하면 True
+        """
+        return self.surface[x] == self.surface[self.edge_to[edge_id]]
+
+    def two_coloring(self) -> list[int] | None:
+        """
+        BFS로 그래프의 정점을 두 가지 색으로 칠합니다.
+
+        Returns:
+            list[int] | None: 이분 그래프라면 각 정점의 색( 0 또는 1 )을 담은 리스트, 아니라면 None
+        """
+
+        color = [-1 for _ in range(self.N + 1)]
+        for s in range(1, self.N + 1):
+            if color[s] != -1:
+                continue
+            color[s] = 0
+            queue = [s]
+            for u in queue:
+                for edge_id in range(self.offset[u], self.offset[u + 1]):
+                    v = self.edge_to[edge_id]
+                    if color[v] == -1:
+                        color[v] = color[u] ^ 1
+                        queue.append(v)
+
+                    # 같은 색의 정점끼리 이어진 경우 홀수 사이클이 존재
+                    elif color[v] == color[u]:
+                        return None
+        return color
+
     def set_potential(self) -> None:
         """
         각 노드의 잠재력을 최대 비용의 절반 값으로 초기화합니다.
@@ -2243,7 +2410,7 @@ class MaximumWeightedMatching:
 
             # 각 노드에 연결된 엣지의 최대 비용 탐색
             for edge_id in range(self.offset[u], self.offset[u + 1]):
-                max_cost = max(max_cost, self.edges[edge_id].cost)
+                max_cost = max(max_cost, self.edge_cost[edge_id])
 
             # 잠재력은 최대 비용의 절반으로 설정
             self.potential[u] = max_cost >> 1
@@ -2260,4 +2427,6 @@ class MaximumWeightedMatching:
         """
 
         # 노드 u와 노드 v 사이에 가중치 w를 가진 간선을 추가
-        self.input_edge.append(InputEdge(u, v, w))
+        self.input_us.append(u)
+        self.input_vs.append(v)
+        self.input_ws.append(w)